@@ -0,0 +1,51 @@
+"""Embedding ANN indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Shipped separately from the initial schema so the indexes are built
+    # after data is loaded. CREATE INDEX CONCURRENTLY cannot run inside a
+    # transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_topics_embedding_hnsw "
+            "ON topics_seen USING hnsw (embedding vector_cosine_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_angles_embedding_hnsw "
+            "ON angles_generated USING hnsw (embedding vector_cosine_ops)"
+        )
+        op.create_index(
+            "ix_angles_selected",
+            "angles_generated",
+            ["run_id"],
+            postgresql_where=sa.text("is_selected"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_angles_selected",
+            table_name="angles_generated",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_angles_embedding_hnsw")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_topics_embedding_hnsw")
@@ -0,0 +1,47 @@
+"""Store embeddings as halfvec
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_TABLES = {
+    "topics_seen": "ix_topics_embedding_hnsw",
+    "angles_generated": "ix_angles_embedding_hnsw",
+}
+
+
+def _convert(column_type: str, opclass: str) -> None:
+    # The HNSW operator class is tied to the column type, so the indexes are
+    # dropped and the columns rewritten in the migration transaction, then the
+    # indexes are rebuilt concurrently once it has committed.
+    for table, index in EMBEDDING_TABLES.items():
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN embedding "
+            f"TYPE {column_type} USING embedding::{column_type}"
+        )
+    with op.get_context().autocommit_block():
+        for table, index in EMBEDDING_TABLES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {table} USING hnsw (embedding {opclass})"
+            )
+
+
+def upgrade() -> None:
+    # pgvector >= 0.7: 2 bytes per dimension halves heap, WAL and index size
+    _convert("halfvec(768)", "halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    _convert("vector(768)", "vector_cosine_ops")
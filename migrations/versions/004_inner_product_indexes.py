@@ -0,0 +1,46 @@
+"""Normalize embeddings and index them for inner product
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_TABLES = {
+    "topics_seen": "ix_topics_embedding_hnsw",
+    "angles_generated": "ix_angles_embedding_hnsw",
+}
+
+
+def _reindex(opclass: str) -> None:
+    with op.get_context().autocommit_block():
+        for table, index in EMBEDDING_TABLES.items():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {table} USING hnsw (embedding {opclass})"
+            )
+
+
+def upgrade() -> None:
+    # With unit-length vectors, inner product equals cosine similarity, so the
+    # cheaper <#> operator can be used. Rows written before embeddings were
+    # normalized at write time are normalized in place first.
+    for table in EMBEDDING_TABLES:
+        op.execute(
+            f"UPDATE {table} SET embedding = l2_normalize(embedding) "
+            "WHERE embedding IS NOT NULL"
+        )
+    _reindex("halfvec_ip_ops")
+
+
+def downgrade() -> None:
+    _reindex("halfvec_cosine_ops")
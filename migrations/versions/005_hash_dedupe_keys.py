@@ -0,0 +1,52 @@
+"""Hash-based dedupe keys for topics and emails
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("topics_seen", sa.Column("url_sha256", sa.LargeBinary(32), nullable=True))
+    # Earlier runs stored the same URL once per run. Only the first sighting
+    # gets the key; later duplicates keep NULL, which UNIQUE permits.
+    op.execute(
+        "UPDATE topics_seen t SET url_sha256 = sha256(convert_to(t.url, 'UTF8')) "
+        "FROM (SELECT DISTINCT ON (url) id FROM topics_seen WHERE url IS NOT NULL "
+        "ORDER BY url, discovered_at) first_seen "
+        "WHERE t.id = first_seen.id"
+    )
+    op.create_unique_constraint("uq_topics_url_sha256", "topics_seen", ["url_sha256"])
+    op.drop_index("ix_topics_url", table_name="topics_seen")
+
+    op.alter_column(
+        "emails_sent",
+        "email_hash",
+        type_=sa.LargeBinary(32),
+        postgresql_using="decode(email_hash, 'hex')",
+    )
+    op.create_unique_constraint("uq_emails_email_hash", "emails_sent", ["email_hash"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_emails_email_hash", "emails_sent", type_="unique")
+    op.alter_column(
+        "emails_sent",
+        "email_hash",
+        type_=sa.String(64),
+        postgresql_using="encode(email_hash, 'hex')",
+    )
+
+    op.create_index("ix_topics_url", "topics_seen", ["url"])
+    op.drop_constraint("uq_topics_url_sha256", "topics_seen", type_="unique")
+    op.drop_column("topics_seen", "url_sha256")
@@ -0,0 +1,58 @@
+"""Store JSON columns as JSONB
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ("agent_runs", "metadata"),
+    ("angles_generated", "second_order_effects"),
+    ("angles_generated", "relevant_for"),
+    ("angle_scores", "metadata"),
+    ("rejected_items", "metadata"),
+    ("emails_sent", "angle_ids"),
+]
+
+
+def upgrade() -> None:
+    # JSONB is stored pre-parsed, so reads skip re-parsing and GIN indexes
+    # can serve containment lookups
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    # "Which emails referenced angle X" and metadata filters on rejections
+    op.create_index(
+        "ix_emails_angle_ids", "emails_sent", ["angle_ids"], postgresql_using="gin"
+    )
+    op.create_index(
+        "ix_rejected_meta", "rejected_items", ["metadata"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rejected_meta", table_name="rejected_items")
+    op.drop_index("ix_emails_angle_ids", table_name="emails_sent")
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,37 @@
+"""BRIN indexes for recency scans
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both tables are append-only in time order, so a BRIN index (a few pages
+    # for millions of rows) lets recency-bounded queries skip old blocks.
+    op.create_index(
+        "ix_topics_discovered_at_brin",
+        "topics_seen",
+        ["discovered_at"],
+        postgresql_using="brin",
+    )
+    op.create_index(
+        "ix_angles_created_at_brin",
+        "angles_generated",
+        ["created_at"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_angles_created_at_brin", table_name="angles_generated")
+    op.drop_index("ix_topics_discovered_at_brin", table_name="topics_seen")
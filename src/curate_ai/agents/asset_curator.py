@@ -1,20 +1,40 @@
 """Asset Curator Agent - Collects source-linked supporting assets."""
 
+import asyncio
+import hashlib
+import re
+import tempfile
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from curate_ai.agents.schemas import CuratedAsset, InsightAngle
 from curate_ai.config import get_settings
 from curate_ai.logging import get_logger
+from curate_ai.services.http import get_http_client
 
 logger = get_logger(__name__)
 
 
 # Common image extensions
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp")
+
+# Maximum assets extracted per source
+MAX_ASSETS_PER_SOURCE = 3
+
+# Maximum characters of a page scanned for images
+MAX_SCAN_CHARS = 1_000_000
+
+# Markdown images: ![alt](url)
+_MD_IMG_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+# Longest markdown image reference matched across a chunk boundary
+MAX_MD_IMG_CHARS = 2048
+
+# HTML images: <img src="...">
+_HTML_IMG_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']')
 
 # GitHub raw content base
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com"
@@ -37,41 +57,54 @@ async def extract_assets_from_url(url: str) -> list[dict]:
     assets = []
 
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(url)
+        client = get_http_client()
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
-            content = response.text
-
-            # Simple extraction of image URLs from HTML/Markdown
-            # Look for common patterns
-            import re
-
-            # Find markdown images: ![alt](url)
-            md_images = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', content)
-            for alt, img_url in md_images:
-                full_url = urljoin(url, img_url)
-                if any(img_url.lower().endswith(ext) for ext in IMAGE_EXTENSIONS):
-                    assets.append({
-                        "url": full_url,
-                        "asset_type": "figure",
-                        "description": alt or "Figure from source",
-                    })
-
-            # Find HTML images: <img src="...">
-            html_images = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', content)
-            for img_url in html_images[:5]:  # Limit to first 5
-                full_url = urljoin(url, img_url)
-                if any(img_url.lower().endswith(ext) for ext in IMAGE_EXTENSIONS):
-                    assets.append({
-                        "url": full_url,
-                        "asset_type": "figure",
-                        "description": "Figure from source",
-                    })
+
+            # Decode and scan the body incrementally. Markdown images are
+            # collected as chunks arrive, so the download stops as soon as
+            # enough assets have been found or the scan limit is reached.
+            # Only the unscanned tail is searched per chunk, so the scan stays
+            # linear in the page size.
+            parts: list[str] = []
+            size = 0
+            tail = ""
+            async for chunk in response.aiter_text():
+                parts.append(chunk)
+                size += len(chunk)
+                tail += chunk
+                md_pos = 0
+                for match in _MD_IMG_RE.finditer(tail):
+                    md_pos = match.end()
+                    alt, img_url = match.groups()
+                    if img_url.lower().endswith(IMAGE_EXTENSIONS):
+                        assets.append({
+                            "url": urljoin(url, img_url),
+                            "asset_type": "figure",
+                            "description": alt or "Figure from source",
+                        })
+                        if len(assets) >= MAX_ASSETS_PER_SOURCE:
+                            return assets
+                tail = tail[max(md_pos, len(tail) - MAX_MD_IMG_CHARS):]
+                if size >= MAX_SCAN_CHARS:
+                    break
+            content = "".join(parts)
+
+        for match in islice(_HTML_IMG_RE.finditer(content), 5):  # Limit to first 5
+            img_url = match.group(1)
+            if img_url.lower().endswith(IMAGE_EXTENSIONS):
+                assets.append({
+                    "url": urljoin(url, img_url),
+                    "asset_type": "figure",
+                    "description": "Figure from source",
+                })
+                if len(assets) >= MAX_ASSETS_PER_SOURCE:
+                    return assets
 
     except Exception as e:
         logger.warning("Failed to extract assets from URL", url=url, error=str(e))
 
-    return assets[:3]  # Limit to 3 assets per source
+    return assets
 
 
 async def fetch_github_readme(repo_url: str) -> CuratedAsset | None:
@@ -97,20 +130,20 @@ async def fetch_github_readme(repo_url: str) -> CuratedAsset | None:
         owner, repo = path_parts[0], path_parts[1]
         readme_url = f"{GITHUB_RAW_BASE}/{owner}/{repo}/main/README.md"
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(readme_url)
-            if response.status_code == 404:
-                # Try master branch
-                readme_url = f"{GITHUB_RAW_BASE}/{owner}/{repo}/master/README.md"
-                response = await client.get(readme_url)
-
-            if response.status_code == 200:
-                return CuratedAsset(
-                    url=readme_url,
-                    asset_type="readme",
-                    description=f"README for {owner}/{repo}",
-                    source_title=f"{owner}/{repo}",
-                )
+        client = get_http_client()
+        response = await client.get(readme_url, timeout=15.0)
+        if response.status_code == 404:
+            # Try master branch
+            readme_url = f"{GITHUB_RAW_BASE}/{owner}/{repo}/master/README.md"
+            response = await client.get(readme_url, timeout=15.0)
+
+        if response.status_code == 200:
+            return CuratedAsset(
+                url=readme_url,
+                asset_type="readme",
+                description=f"README for {owner}/{repo}",
+                source_title=f"{owner}/{repo}",
+            )
     except Exception as e:
         logger.warning("Failed to fetch GitHub README", url=repo_url, error=str(e))
 
@@ -143,20 +176,30 @@ async def download_asset(
         asset_dir = artifacts_dir / asset_type
         asset_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate filename from URL
-        parsed = urlparse(url)
-        filename = Path(parsed.path).name
-        if not filename:
-            filename = f"asset_{hash(url) % 10000}"
-
+        # Content-address the file by URL so repeat runs reuse earlier downloads
+        suffix = Path(urlparse(url).path).suffix or ".bin"
+        filename = hashlib.blake2b(url.encode(), digest_size=8).hexdigest() + suffix
         local_path = asset_dir / filename
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Write content
-            local_path.write_bytes(response.content)
+        if local_path.exists():
+            logger.debug("Asset already downloaded", url=url, local_path=str(local_path))
+            return str(local_path)
+
+        # Stream the body to a temporary file and rename it into place, so
+        # memory stays flat and a failed download never leaves a partial
+        # file behind to be picked up as a cache hit. The temporary name is
+        # unique per call, so overlapping downloads never share a file
+        tmp_file = tempfile.NamedTemporaryFile(dir=asset_dir, suffix=".part", delete=False)
+        tmp_path = Path(tmp_file.name)
+        client = get_http_client()
+        try:
+            with tmp_file:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        tmp_file.write(chunk)
+            tmp_path.replace(local_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
         logger.debug("Downloaded asset", url=url, local_path=str(local_path))
         return str(local_path)
@@ -166,6 +209,79 @@ async def download_asset(
         return None
 
 
+async def _download_bounded(
+    url: str,
+    asset_type: str,
+    semaphore: asyncio.Semaphore,
+) -> str | None:
+    """Download one asset while holding a slot of the semaphore."""
+    async with semaphore:
+        return await download_asset(url, asset_type)
+
+
+async def _curate_one(
+    angle: InsightAngle,
+    source_url: str,
+    semaphore: asyncio.Semaphore,
+    download: bool,
+    downloads: dict[str, asyncio.Task[str | None]],
+) -> list[CuratedAsset]:
+    """
+    Curate assets for a single angle, bounding in-flight requests with the semaphore.
+    
+    Downloads are shared through ``downloads`` (asset URL -> task), so angles
+    that point at the same figure wait on a single download.
+    """
+    if not source_url:
+        return []
+
+    # Extract assets from the source URL
+    async with semaphore:
+        extracted = await extract_assets_from_url(source_url)
+
+    assets = [
+        CuratedAsset(
+            url=asset_data["url"],
+            asset_type=asset_data["asset_type"],
+            description=asset_data["description"],
+            source_title=f"From: {source_url}",
+        )
+        # The same image can be matched more than once on a page
+        for asset_data in {a["url"]: a for a in extracted}.values()
+    ]
+
+    if download and assets:
+        for asset in assets:
+            if asset.url not in downloads:
+                downloads[asset.url] = asyncio.create_task(
+                    _download_bounded(asset.url, asset.asset_type, semaphore)
+                )
+        local_paths = await asyncio.gather(*(downloads[asset.url] for asset in assets))
+        for asset, local_path in zip(assets, local_paths, strict=True):
+            asset.local_path = local_path
+
+    # Try to get README if it's a GitHub link
+    if "github.com" in source_url:
+        async with semaphore:
+            readme = await fetch_github_readme(source_url)
+        if readme:
+            assets.append(readme)
+
+    # Always include the source as a link asset
+    assets.append(CuratedAsset(
+        url=source_url,
+        asset_type="link",
+        description="Original source",
+    ))
+
+    logger.debug(
+        "Curated assets for angle",
+        angle_id=angle.id,
+        asset_count=len(assets),
+    )
+    return assets
+
+
 async def curate_assets_for_angles(
     angles: list[InsightAngle],
     source_urls: dict[str, str],  # topic_id -> url
@@ -174,6 +290,9 @@ async def curate_assets_for_angles(
     """
     Curate supporting assets for a list of insight angles.
     
+    Angles are processed concurrently over the shared HTTP client, with the
+    number of in-flight requests capped by ``max_concurrent_fetches``.
+    
     Args:
         angles: List of insight angles
         source_urls: Mapping of topic_id to source URL
@@ -182,53 +301,26 @@ async def curate_assets_for_angles(
     Returns:
         Dictionary mapping angle_id to list of curated assets
     """
-    result: dict[str, list[CuratedAsset]] = {}
-
-    for angle in angles:
-        assets: list[CuratedAsset] = []
-        source_url = source_urls.get(angle.topic_id, "")
-
-        if not source_url:
-            result[angle.id] = []
-            continue
+    settings = get_settings()
+    semaphore = asyncio.Semaphore(settings.max_concurrent_fetches)
+    downloads: dict[str, asyncio.Task[str | None]] = {}
 
-        # Extract assets from the source URL
-        extracted = await extract_assets_from_url(source_url)
-        for asset_data in extracted:
-            asset = CuratedAsset(
-                url=asset_data["url"],
-                asset_type=asset_data["asset_type"],
-                description=asset_data["description"],
-                source_title=f"From: {source_url}",
+    results = await asyncio.gather(
+        *(
+            _curate_one(
+                angle, source_urls.get(angle.topic_id, ""), semaphore, download, downloads
             )
+            for angle in angles
+        ),
+        return_exceptions=True,
+    )
 
-            if download:
-                local_path = await download_asset(
-                    asset.url, asset.asset_type
-                )
-                asset.local_path = local_path
-
-            assets.append(asset)
-
-        # Try to get README if it's a GitHub link
-        if "github.com" in source_url:
-            readme = await fetch_github_readme(source_url)
-            if readme:
-                assets.append(readme)
-
-        # Always include the source as a link asset
-        assets.append(CuratedAsset(
-            url=source_url,
-            asset_type="link",
-            description="Original source",
-        ))
-
+    result: dict[str, list[CuratedAsset]] = {}
+    for angle, assets in zip(angles, results, strict=True):
+        if isinstance(assets, BaseException):
+            logger.warning("Failed to curate assets", angle_id=angle.id, error=str(assets))
+            assets = []
         result[angle.id] = assets
-        logger.debug(
-            "Curated assets for angle",
-            angle_id=angle.id,
-            asset_count=len(assets),
-        )
 
     logger.info(
         "Curated assets",
@@ -1,5 +1,7 @@
 """Editor Agent - Compresses and formats output for email-ready briefs."""
 
+from collections.abc import Iterator
+
 from pydantic import BaseModel, Field
 
 from curate_ai.agents.schemas import (
@@ -38,7 +40,7 @@ class EditedAngle(BaseModel):
     )
 
 
-async def compress_angle(
+def compress_angle(
     angle: InsightAngle,
     topic_title: str,
     assets: list[CuratedAsset],
@@ -57,23 +59,25 @@ async def compress_angle(
     # Compress the stance to ≤2 lines (~200 chars)
     insight = angle.stance
     if len(insight) > 200:
-        # Truncate at sentence boundary if possible
-        sentences = insight.split(". ")
-        compressed = sentences[0]
-        if len(compressed) <= 200:
-            insight = compressed + "."
+        # Truncate at the first sentence boundary if it falls within the limit
+        end = insight.find(". ", 0, 202)
+        if end != -1:
+            insight = insight[:end + 1]
         else:
             insight = insight[:197] + "..."
 
     # Compress why_it_matters
     why = angle.why_it_matters
     if len(why) > 300:
-        sentences = why.split(". ")
-        why = ". ".join(sentences[:2]) + "."
+        # Keep the first two sentences
+        end = why.find(". ")
+        if end != -1:
+            end = why.find(". ", end + 2)
+        why = (why if end == -1 else why[:end]) + "."
 
     # Generate framing points from second-order effects
     framing = [
-        effect[:50] if len(effect) <= 50 else effect[:47] + "..."
+        (effect[:47] + "...") if len(effect) > 50 else effect
         for effect in angle.second_order_effects[:4]
     ]
 
@@ -94,6 +98,7 @@ async def compress_angle(
         assets=visual_assets[:3],
         confidence=angle.confidence,
         original_topic_title=topic_title,
+        angle_id=angle.id,
     )
 
 
@@ -126,7 +131,7 @@ async def create_email_brief(
         assets = assets_map.get(angle.id, [])
         title = topic_titles.get(angle.topic_id, "Unknown Topic")
 
-        final_angle = await compress_angle(angle, title, assets)
+        final_angle = compress_angle(angle, title, assets)
         final_angles.append(final_angle)
 
     brief = EmailBrief(
@@ -146,28 +151,30 @@ async def create_email_brief(
     return brief
 
 
-def validate_brief_quality(brief: EmailBrief) -> list[str]:
-    """
-    Validate the quality of an email brief.
-    
-    Returns list of issues (empty if brief passes quality check).
-    """
-    issues = []
-
-    if len(brief.angles) < 1:
-        issues.append("No angles in brief")
-
-    if len(brief.angles) > 5:
-        issues.append("Too many angles (max 5)")
+def _iter_issues(brief: EmailBrief) -> Iterator[str]:
+    """Yield quality issues for a brief in a single pass over its angles."""
+    angle_count = len(brief.angles)
+    if angle_count < 1:
+        yield "No angles in brief"
+    elif angle_count > 5:
+        yield "Too many angles (max 5)"
 
-    for i, angle in enumerate(brief.angles):
-        if len(angle.insight) > 200:
-            issues.append(f"Angle {i+1} insight too long ({len(angle.insight)} chars)")
+    for i, angle in enumerate(brief.angles, start=1):
+        insight_len = len(angle.insight)
+        if insight_len > 200:
+            yield f"Angle {i} insight too long ({insight_len} chars)"
 
         if len(angle.framing_points) < 2:
-            issues.append(f"Angle {i+1} needs more framing points")
+            yield f"Angle {i} needs more framing points"
 
         if not angle.supporting_links:
-            issues.append(f"Angle {i+1} has no supporting links")
+            yield f"Angle {i} has no supporting links"
+
 
-    return issues
+def validate_brief_quality(brief: EmailBrief) -> list[str]:
+    """
+    Validate the quality of an email brief.
+    
+    Returns list of issues (empty if brief passes quality check).
+    """
+    return list(_iter_issues(brief))
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 
+from curate_ai.agents.redundancy_checker import compute_sketch
 from curate_ai.agents.schemas import InsightAngle, ScoredTopic
 from curate_ai.logging import get_logger
 
@@ -49,7 +50,7 @@ class GeneratedInsight(BaseModel):
     )
 
 
-async def generate_insight(topic: ScoredTopic) -> InsightAngle:
+def generate_insight(topic: ScoredTopic) -> InsightAngle:
     """
     Generate an opinionated insight angle from a scored topic.
     
@@ -60,14 +61,18 @@ async def generate_insight(topic: ScoredTopic) -> InsightAngle:
     - Target specific audiences
     """
     # Placeholder implementation - actual generation happens via LLM
+    stance = f"This development in '{topic.title[:50]}' signals a shift in..."
+    why_it_matters = "This matters because..."
     return InsightAngle(
-        topic_id=topic.id,
-        stance=f"This development in '{topic.title[:50]}' signals a shift in...",
-        why_it_matters="This matters because...",
+        topic_id=topic.ensure_id(),
+        stance=stance,
+        why_it_matters=why_it_matters,
         second_order_effects=["Effect 1", "Effect 2"],
         relevant_for=["ML engineers", "AI researchers"],
         confidence=topic.combined_score,
         supporting_evidence=[topic.url],
+        # Embedded once here; dedup and storage reuse the cached sketch
+        sketch=tuple(compute_sketch(f"{stance} {why_it_matters}").tolist()),
     )
 
 
@@ -85,19 +90,11 @@ async def generate_angles_batch(
     Returns:
         List of generated insight angles
     """
-    angles: list[InsightAngle] = []
-
-    for topic in topics:
-        try:
-            for _ in range(angles_per_topic):
-                angle = await generate_insight(topic)
-                angles.append(angle)
-        except Exception as e:
-            logger.error(
-                "Failed to generate angle",
-                topic=topic.title[:50],
-                error=str(e),
-            )
+    angles = [
+        generate_insight(topic)
+        for topic in topics
+        for _ in range(angles_per_topic)
+    ]
 
     logger.info("Generated angles", topic_count=len(topics), angle_count=len(angles))
     return angles
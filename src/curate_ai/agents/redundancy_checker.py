@@ -1,53 +1,138 @@
 """Redundancy Checker Agent - Uses semantic memory to detect and penalize repeated themes."""
 
+import hashlib
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+import numpy.typing as npt
+
 from curate_ai.agents.schemas import InsightAngle
 from curate_ai.config import get_settings
 from curate_ai.logging import get_logger
 
+if TYPE_CHECKING:
+    from curate_ai.db.repositories import AngleRepository
+
 logger = get_logger(__name__)
 
 
-async def compute_embedding(text: str) -> list[float]:
+# The placeholder embedding is a tiled 32-byte digest, so its intrinsic rank is
+# 32. Similarity checks run on this compact sketch; cosine is unchanged by the
+# tiling, so the full-width vector is only materialised for storage.
+# Sketches and embeddings are L2-normalized, so cosine similarity is a plain
+# inner product (pgvector's <#> operator on the database side).
+SKETCH_DIM = 32
+
+# Prior sketches compared per block before checking for an early exit
+SIMILARITY_BLOCK_ROWS = 4096
+
+# Sketches, embeddings and similarity matrices are all float32
+FloatArray = npt.NDArray[np.float32]
+
+
+def compute_sketch(text: str) -> FloatArray:
     """
-    Compute embedding for text using the configured embedding model.
+    Compute the compact similarity sketch for text.
     
-    In production, this would call the Gemini embedding API.
-    Returns a 768-dimensional vector.
+    Returns a unit-length SKETCH_DIM-dimensional float32 vector derived from
+    the text hash.
     """
     # Placeholder - will be replaced with actual embedding call
-    import hashlib
-    # Generate deterministic pseudo-embedding from text hash
     hash_bytes = hashlib.sha256(text.encode()).digest()
-    # Expand to 768 dimensions (simplified placeholder)
-    embedding = []
-    for i in range(768):
-        byte_idx = i % 32
-        embedding.append((hash_bytes[byte_idx] / 255.0) - 0.5)
-    return embedding
+    sketch = np.frombuffer(hash_bytes, dtype=np.uint8).astype(np.float32) / 255.0 - 0.5
+    return normalize_embeddings(sketch)
+
+
+def expand_sketch(sketch: FloatArray) -> FloatArray:
+    """Project a sketch (or a stack of sketches) to unit vectors of the configured dimension."""
+    dim = get_settings().vector_dimension
+    reps = -(-dim // SKETCH_DIM)
+    return normalize_embeddings(np.tile(sketch, reps)[..., :dim])
+
+
+def fold_embeddings(vectors: FloatArray) -> FloatArray:
+    """
+    Reduce stored full-width embeddings back to sketches (inverse of expand_sketch).
+    
+    Raises:
+        ValueError: If the vectors are not tiled sketches, since their first
+            SKETCH_DIM components would not preserve cosine similarity
+    """
+    sketches = vectors[..., :SKETCH_DIM]
+    # Tolerance covers embeddings round-tripped through halfvec storage
+    if not np.allclose(normalize_embeddings(vectors), expand_sketch(sketches), atol=1e-3):
+        raise ValueError("Embeddings are not expanded sketches and cannot be folded")
+    return sketches
+
+
+def compute_embedding(text: str) -> FloatArray:
+    """
+    Compute embedding for text using the configured embedding model.
+    
+    In production, this would call the Gemini embedding API.
+    Returns a unit-length 768-dimensional float32 vector for storage in pgvector.
+    """
+    return expand_sketch(compute_sketch(text))
+
+
+def compute_embeddings(texts: list[str]) -> FloatArray:
+    """Compute embeddings for several texts as one contiguous (B, dim) float32 matrix."""
+    if not texts:
+        return np.empty((0, get_settings().vector_dimension), dtype=np.float32)
+    return expand_sketch(np.stack([compute_sketch(text) for text in texts]))
+
+
+def angle_sketch(angle: InsightAngle) -> FloatArray:
+    """Get an angle's cached sketch, computing it if the angle has none."""
+    if angle.sketch is not None:
+        return np.asarray(angle.sketch, dtype=np.float32)
+    return compute_sketch(f"{angle.stance} {angle.why_it_matters}")
+
+
+def angle_embeddings(angles: list[InsightAngle]) -> FloatArray:
+    """Get storage embeddings for angles as one (B, dim) float32 matrix."""
+    if not angles:
+        return np.empty((0, get_settings().vector_dimension), dtype=np.float32)
+    return expand_sketch(np.stack([angle_sketch(angle) for angle in angles]))
+
 
+def normalize_embeddings(vectors: FloatArray) -> FloatArray:
+    """L2-normalize vectors along the last axis, leaving zero vectors untouched."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return cast(FloatArray, vectors / np.where(norms == 0, 1.0, norms))
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+
+def cosine_similarity(a: list[float] | FloatArray, b: list[float] | FloatArray) -> float:
     """Calculate cosine similarity between two vectors."""
-    dot_product = sum(x * y for x, y in zip(a, b))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
+    a_arr = np.asarray(a, dtype=np.float32)
+    b_arr = np.asarray(b, dtype=np.float32)
+    norm_a = np.linalg.norm(a_arr)
+    norm_b = np.linalg.norm(b_arr)
     if norm_a == 0 or norm_b == 0:
         return 0.0
-    return dot_product / (norm_a * norm_b)
+    return float(np.dot(a_arr, b_arr) / (norm_a * norm_b))
+
+
+def pairwise_cosine(vectors: FloatArray) -> FloatArray:
+    """Cosine similarity between every pair of rows, as one (N, N) matrix product."""
+    unit = normalize_embeddings(np.asarray(vectors, dtype=np.float32))
+    return cast(FloatArray, unit @ unit.T)
 
 
-async def check_redundancy(
+def check_redundancy(
     angle: InsightAngle,
-    prior_embeddings: list[list[float]],
+    prior_matrix: FloatArray,
     threshold: float | None = None,
+    sketch: FloatArray | None = None,
 ) -> tuple[bool, float, str | None]:
     """
     Check if an angle is redundant against prior angles.
     
     Args:
         angle: The insight angle to check
-        prior_embeddings: List of embeddings from prior angles
+        prior_matrix: (N, SKETCH_DIM) matrix of L2-normalized prior sketches
         threshold: Similarity threshold (default from config)
+        sketch: Precomputed sketch for the angle (default from the angle)
     
     Returns:
         Tuple of (is_redundant, max_similarity, reason)
@@ -56,18 +141,21 @@ async def check_redundancy(
     if threshold is None:
         threshold = settings.similarity_threshold
 
-    # Compute embedding for this angle
-    angle_text = f"{angle.stance} {angle.why_it_matters}"
-    angle_embedding = await compute_embedding(angle_text)
-
-    if not prior_embeddings:
+    if len(prior_matrix) == 0:
         return False, 0.0, None
 
-    # Find maximum similarity with any prior angle
+    if sketch is None:
+        sketch = angle_sketch(angle)
+
+    # Rows and sketch are unit length, so a matrix-vector product gives the
+    # cosines. Blocks are scanned in order and the scan stops at the first
+    # block that crosses the threshold.
     max_sim = 0.0
-    for prior_emb in prior_embeddings:
-        sim = cosine_similarity(angle_embedding, prior_emb)
-        max_sim = max(max_sim, sim)
+    for start in range(0, len(prior_matrix), SIMILARITY_BLOCK_ROWS):
+        sims = prior_matrix[start:start + SIMILARITY_BLOCK_ROWS] @ sketch
+        max_sim = max(max_sim, float(sims.max()))
+        if max_sim >= threshold:
+            break
 
     is_redundant = max_sim >= threshold
     reason = None
@@ -80,17 +168,21 @@ async def check_redundancy(
 async def deduplicate_angles(
     angles: list[InsightAngle],
     prior_embeddings: list[list[float]] | None = None,
+    angle_repo: "AngleRepository | None" = None,
 ) -> tuple[list[InsightAngle], list[tuple[InsightAngle, str]]]:
     """
     Remove redundant angles from the list.
     
     This performs both:
-    1. Cross-run deduplication (against prior_embeddings from DB)
+    1. Cross-run deduplication (nearest-neighbour query over the last
+       redundancy_lookback_days in the database via angle_repo, and/or
+       against prior_embeddings passed in memory)
     2. Within-run deduplication (against other angles in this batch)
     
     Args:
         angles: List of insight angles to deduplicate
-        prior_embeddings: Embeddings from database of prior angles
+        prior_embeddings: Embeddings of prior angles (expanded sketches) to check in memory
+        angle_repo: Repository used to query stored angles through the HNSW index
     
     Returns:
         Tuple of (deduplicated_angles, rejected_with_reasons)
@@ -103,13 +195,45 @@ async def deduplicate_angles(
 
     deduplicated: list[InsightAngle] = []
     rejected: list[tuple[InsightAngle, str]] = []
-    current_embeddings: list[list[float]] = list(prior_embeddings)
+    prior_matrix = np.asarray(prior_embeddings, dtype=np.float32)
+    prior_matrix = prior_matrix.reshape(-1, settings.vector_dimension)
+    prior_sketches = normalize_embeddings(fold_embeddings(prior_matrix))
 
-    for angle in angles:
-        is_redundant, similarity, reason = await check_redundancy(
-            angle, current_embeddings, threshold
+    sketches = [angle_sketch(angle) for angle in angles]
+    # Similarities within the batch are computed once as a single GEMM;
+    # each angle is then compared only against the earlier angles kept
+    batch_sims = pairwise_cosine(np.stack(sketches)) if angles else np.empty((0, 0))
+    kept_rows: list[int] = []
+
+    # Probe the database for every angle's nearest prior angle in one round trip
+    db_similarities = [0.0] * len(angles)
+    if angle_repo is not None and angles:
+        embeddings = expand_sketch(np.stack(sketches)).astype(np.float16)
+        db_similarities = await angle_repo.get_max_similarities(
+            cast("list[list[float]]", embeddings.tolist()),
+            max_age_days=settings.redundancy_lookback_days,
         )
 
+    rows = zip(angles, sketches, db_similarities, strict=True)
+    for row, (angle, sketch, similarity) in enumerate(rows):
+        is_redundant, reason = False, None
+        if similarity >= threshold:
+            is_redundant = True
+            reason = f"Too similar to prior angle (similarity: {similarity:.2f} >= {threshold})"
+
+        if not is_redundant:
+            is_redundant, similarity, reason = check_redundancy(
+                angle, prior_sketches, threshold, sketch=sketch
+            )
+
+        if not is_redundant and kept_rows:
+            similarity = float(batch_sims[row, kept_rows].max())
+            if similarity >= threshold:
+                is_redundant = True
+                reason = (
+                    f"Too similar to prior angle (similarity: {similarity:.2f} >= {threshold})"
+                )
+
         if is_redundant:
             rejected.append((angle, reason or "Redundant angle"))
             logger.debug(
@@ -119,10 +243,8 @@ async def deduplicate_angles(
             )
         else:
             deduplicated.append(angle)
-            # Add this angle's embedding to check against subsequent angles
-            angle_text = f"{angle.stance} {angle.why_it_matters}"
-            embedding = await compute_embedding(angle_text)
-            current_embeddings.append(embedding)
+            # Subsequent angles are checked against this one
+            kept_rows.append(row)
 
     logger.info(
         "Deduplicated angles",
@@ -1,10 +1,14 @@
 """Relevance Filter Agent - Scores and filters topics based on relevance, novelty, and impact."""
 
+import asyncio
+import heapq
+import re
+
 from pydantic import BaseModel, Field
 
 from curate_ai.agents.schemas import ScoredTopic, TopicCandidate
 from curate_ai.config import get_settings
-from curate_ai.logging import get_logger
+from curate_ai.logging import debug_enabled, get_logger
 
 logger = get_logger(__name__)
 
@@ -22,6 +26,64 @@ PRACTICAL_INDICATORS = [
     "tutorial", "guide", "how to", "production", "deployment",
 ]
 
+# Keywords that indicate AI/ML content
+AI_KEYWORDS = ["ai", "ml", "machine learning", "neural", "llm", "transformer", "model"]
+
+# Category of every indicator, so all of them are found in a single scan
+_INDICATOR_CATEGORIES = {
+    **dict.fromkeys(HYPE_INDICATORS, "hype"),
+    **dict.fromkeys(PRACTICAL_INDICATORS, "practical"),
+    **dict.fromkeys(AI_KEYWORDS, "ai"),
+}
+
+
+
+def _trie_pattern(words: list[str]) -> str:
+    """
+    Build a regex alternation for words, factored along a prefix trie.
+    
+    A flat "a|b|c" alternation retries every keyword at each text position.
+    Nesting shared prefixes means each position only descends the branches
+    that still match, so scan cost tracks the text rather than the number
+    of keywords. Where one keyword is a prefix of another, the longest match
+    at a position wins.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}  # Terminal marker
+
+    def render(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return render(trie)
+
+
+# Zero-width lookahead so overlapping indicators are all reported, matching
+# the substring semantics of `indicator in text`. Case-insensitive, so callers
+# need not build a lowercased copy of the text.
+_INDICATOR_RE = re.compile(
+    "(?=(" + _trie_pattern(list(_INDICATOR_CATEGORIES)) + "))",
+    re.IGNORECASE,
+)
+
+
+def count_indicators(text: str) -> dict[str, int]:
+    """Count distinct hype, practical and AI indicators in text in one pass."""
+    counts = {"hype": 0, "practical": 0, "ai": 0}
+    for indicator in {match.lower() for match in _INDICATOR_RE.findall(text)}:
+        counts[_INDICATOR_CATEGORIES[indicator]] += 1
+    return counts
+
 
 class TopicScoreOutput(BaseModel):
     """Structured output for topic scoring."""
@@ -52,6 +114,26 @@ class TopicScoreOutput(BaseModel):
     )
 
 
+def _check_heuristics(topic: TopicCandidate) -> tuple[bool, str | None, dict[str, int]]:
+    """Apply the heuristic filters, also returning the indicator counts for scoring."""
+    # Check for empty/minimal content first; it is O(1) and skips the scan
+    if len(topic.summary) < 50:
+        return True, "Insufficient summary content", {}
+
+    counts = count_indicators(f"{topic.title} {topic.summary}")
+
+    # Check for hype indicators
+    hype_count = counts["hype"]
+    if hype_count >= 3:
+        return True, f"High hype content (matched {hype_count} hype indicators)", counts
+
+    # Check for non-AI/ML content that slipped through
+    if not counts["ai"]:
+        return True, "Not AI/ML related content", counts
+
+    return False, None, counts
+
+
 def apply_heuristic_filters(topic: TopicCandidate) -> tuple[bool, str | None]:
     """
     Apply quick heuristic filters before LLM scoring.
@@ -59,25 +141,35 @@ def apply_heuristic_filters(topic: TopicCandidate) -> tuple[bool, str | None]:
     Returns:
         Tuple of (should_reject, rejection_reason)
     """
-    title_lower = topic.title.lower()
-    summary_lower = topic.summary.lower()
-    combined = f"{title_lower} {summary_lower}"
-
-    # Check for hype indicators
-    hype_count = sum(1 for h in HYPE_INDICATORS if h in combined)
-    if hype_count >= 3:
-        return True, f"High hype content (matched {hype_count} hype indicators)"
+    should_reject, reason, _ = _check_heuristics(topic)
+    return should_reject, reason
 
-    # Check for empty/minimal content
-    if len(topic.summary) < 50:
-        return True, "Insufficient summary content"
-
-    # Check for non-AI/ML content that slipped through
-    ai_keywords = ["ai", "ml", "machine learning", "neural", "llm", "transformer", "model"]
-    if not any(kw in combined for kw in ai_keywords):
-        return True, "Not AI/ML related content"
 
-    return False, None
+def _promote(
+    topic: TopicCandidate,
+    *,
+    relevance_score: float,
+    novelty_score: float,
+    impact_score: float,
+    combined_score: float,
+    rejection_reason: str | None,
+    is_rejected: bool,
+) -> ScoredTopic:
+    """
+    Build a ScoredTopic from an already-validated candidate without re-validating it.
+    
+    Only the ScoredTopic score fields can be set; scores must already lie in
+    [0, 1], since model_construct skips the field constraints.
+    """
+    return ScoredTopic.model_construct(
+        **topic.__dict__,
+        relevance_score=relevance_score,
+        novelty_score=novelty_score,
+        impact_score=impact_score,
+        combined_score=combined_score,
+        rejection_reason=rejection_reason,
+        is_rejected=is_rejected,
+    )
 
 
 async def score_topic(topic: TopicCandidate) -> ScoredTopic:
@@ -86,11 +178,11 @@ async def score_topic(topic: TopicCandidate) -> ScoredTopic:
     
     This function would be called by the agent to evaluate each topic.
     """
-    # Apply heuristic filters first
-    should_reject, reason = apply_heuristic_filters(topic)
+    # Apply heuristic filters first; the same scan supplies the indicator counts
+    should_reject, reason, counts = _check_heuristics(topic)
     if should_reject:
-        return ScoredTopic(
-            **topic.model_dump(),
+        return _promote(
+            topic,
             relevance_score=0.0,
             novelty_score=0.0,
             impact_score=0.0,
@@ -100,16 +192,12 @@ async def score_topic(topic: TopicCandidate) -> ScoredTopic:
         )
 
     # Calculate practical relevance boost
-    practical_boost = sum(
-        0.05 for p in PRACTICAL_INDICATORS
-        if p in f"{topic.title} {topic.summary}".lower()
-    )
-    practical_boost = min(practical_boost, 0.2)
+    practical_boost = min(0.05 * counts["practical"], 0.2)
 
     # Default scores (will be overridden by LLM in actual agent call)
     # These are placeholders for the tool function
-    return ScoredTopic(
-        **topic.model_dump(),
+    return _promote(
+        topic,
         relevance_score=0.5 + practical_boost,
         novelty_score=0.5,
         impact_score=0.5,
@@ -135,33 +223,49 @@ async def filter_topics(
     Returns:
         Filtered and scored topics, sorted by combined score
     """
+    settings = get_settings()
+    semaphore = asyncio.Semaphore(settings.max_concurrent_scoring)
+
+    async def _score(topic: TopicCandidate) -> ScoredTopic:
+        async with semaphore:
+            return await score_topic(topic)
+
+    # Score all topics concurrently, bounded by max_concurrent_scoring
+    results = await asyncio.gather(*(_score(t) for t in topics), return_exceptions=True)
+
     scored: list[ScoredTopic] = []
     rejected_count = 0
+    # Checked once so per-rejection debug events cost nothing when disabled
+    log_rejections = debug_enabled(__name__)
 
-    for topic in topics:
-        scored_topic = await score_topic(topic)
-        if scored_topic.is_rejected:
+    for topic, scored_topic in zip(topics, results, strict=True):
+        if isinstance(scored_topic, BaseException):
             rejected_count += 1
-            logger.debug(
-                "Rejected topic",
+            logger.warning(
+                "Failed to score topic",
                 title=topic.title[:50],
-                reason=scored_topic.rejection_reason,
+                error=str(scored_topic),
             )
+        elif scored_topic.is_rejected:
+            rejected_count += 1
+            if log_rejections:
+                logger.debug(
+                    "Rejected topic",
+                    title=topic.title[:50],
+                    reason=scored_topic.rejection_reason,
+                )
         else:
             scored.append(scored_topic)
 
-    # Filter by minimum score
-    filtered = [t for t in scored if t.combined_score >= min_combined_score]
-
-    # Sort by combined score and take top N
-    filtered.sort(key=lambda t: t.combined_score, reverse=True)
-    result = filtered[:max_topics]
+    # Filter by minimum score and take the top N by combined score in one pass
+    passed = [t for t in scored if t.combined_score >= min_combined_score]
+    result = heapq.nlargest(max_topics, passed, key=lambda t: t.combined_score)
 
     logger.info(
         "Filtered topics",
         input_count=len(topics),
         rejected=rejected_count,
-        passed_threshold=len(filtered),
+        passed_threshold=len(passed),
         returned=len(result),
     )
 
@@ -1,16 +1,24 @@
 """Pydantic schemas for structured agent I/O."""
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class TopicCandidate(BaseModel):
     """A candidate topic discovered by the Source Scout agent."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str | None = Field(
+        default=None,
+        description="Topic ID, assigned on persistence (see ensure_id)",
+    )
     title: str = Field(..., description="Title of the paper/blog/release")
     source: str = Field(..., description="Source name (arXiv, OpenAI Blog, etc.)")
     source_type: Literal[
@@ -22,6 +30,7 @@ class TopicCandidate(BaseModel):
         "rss",
         "reddit",
         "web_search",
+        "arxiv",
     ] = Field(
         ..., description="Type of source"
     )
@@ -31,6 +40,12 @@ class TopicCandidate(BaseModel):
     authors: list[str] = Field(default_factory=list, description="Authors if available")
     tags: list[str] = Field(default_factory=list, description="Relevant tags/categories")
 
+    def ensure_id(self) -> str:
+        """Return the topic ID, generating it on first use."""
+        if self.id is None:
+            self.id = str(uuid.uuid4())
+        return self.id
+
 
 class ScoredTopic(TopicCandidate):
     """A topic with relevance scores from the Relevance Filter agent."""
@@ -82,6 +97,12 @@ class InsightAngle(BaseModel):
     supporting_evidence: list[str] = Field(
         default_factory=list, description="Key evidence points"
     )
+    sketch: tuple[float, ...] | None = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="Cached similarity sketch of stance + why_it_matters",
+    )
 
 
 class CuratedAsset(BaseModel):
@@ -133,6 +154,9 @@ class FinalAngle(BaseModel):
     original_topic_title: str = Field(
         ..., description="Title of the original topic"
     )
+    angle_id: str | None = Field(
+        None, description="ID of the insight angle this was edited from"
+    )
 
 
 class EmailBrief(BaseModel):
@@ -140,7 +164,7 @@ class EmailBrief(BaseModel):
 
     run_id: str = Field(..., description="Pipeline run ID")
     generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Generation timestamp",
     )
     angles: list[FinalAngle] = Field(
@@ -164,7 +188,7 @@ class PipelineContext(BaseModel):
     """Context passed between pipeline stages."""
 
     run_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=_utcnow)
     config_hash: str | None = None
     dry_run: bool = False
     debug: bool = False
@@ -1,5 +1,6 @@
 """Configuration management for Curate AI using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -41,6 +42,7 @@ class Settings(BaseSettings):
     # Vector Store
     vector_dimension: int = Field(default=768)
     similarity_threshold: float = Field(default=0.85)
+    redundancy_lookback_days: int = Field(default=90)
 
     # Sources Configuration
     arxiv_categories: str = Field(default="cs.AI,cs.LG,cs.CL")
@@ -49,26 +51,28 @@ class Settings(BaseSettings):
     # Storage
     artifacts_dir: Path = Field(default=Path("./artifacts"))
 
+    # Networking
+    max_concurrent_fetches: int = Field(default=8)
+    max_concurrent_scoring: int = Field(default=8)
+    max_concurrent_llm_calls: int = Field(default=10)
+
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
     log_format: Literal["json", "console"] = Field(default="json")
 
-    @property
+    @cached_property
     def arxiv_categories_list(self) -> list[str]:
         """Get arxiv categories as a list."""
         return [cat.strip() for cat in self.arxiv_categories.split(",")]
 
-    @property
+    @cached_property
     def artifacts_path(self) -> Path:
-        """Ensure artifacts directory exists and return path."""
+        """Ensure artifacts directory exists and return path, creating it once."""
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
         return self.artifacts_dir
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    return settings
+    """Get the settings instance, loading it on first use."""
+    return Settings()
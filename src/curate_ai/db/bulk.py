@@ -0,0 +1,34 @@
+"""Batched inserts for high-volume writers."""
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from curate_ai.db.models import Base
+
+# Rows sent per executemany call; matches the engine's insertmanyvalues page size
+DEFAULT_PAGE_SIZE = 1000
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> None:
+    """
+    Insert many rows with a single Core executemany per page.
+    
+    SQLAlchemy batches each page into multi-row INSERT ... VALUES statements
+    (insertmanyvalues), so this costs a handful of round trips instead of one
+    per ORM object.
+    
+    Args:
+        session: Active database session
+        model: Mapped model class whose table receives the rows
+        rows: Column-name keyed row dictionaries
+        page_size: Maximum rows per executemany call
+    """
+    for start in range(0, len(rows), page_size):
+        await session.execute(insert(model), rows[start:start + page_size])
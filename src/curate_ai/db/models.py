@@ -4,17 +4,32 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import DateTime, Float, ForeignKey, LargeBinary, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
+class BinaryHALFVEC(HALFVEC):
+    """
+    HALFVEC column bound without text conversion.
+    
+    get_engine() registers pgvector's binary asyncpg codec on every
+    connection, which encodes lists, arrays and HalfVector values directly,
+    so values are passed through instead of being rendered as '[...]' text.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect: Any) -> None:
+        return None
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
     type_annotation_map = {
-        dict[str, Any]: JSON,
+        dict[str, Any]: JSONB,
     }
 
 
@@ -37,9 +52,9 @@ class AgentRun(Base):
         String(20),
         default="running",
     )  # running, completed, failed
-    config_hash: Mapped[str | None] = mapped_column(String(64))  # SHA256 of config
+    config_hash: Mapped[str | None] = mapped_column(String(64))  # BLAKE2b of config
     duration_seconds: Mapped[float | None] = mapped_column(Float)
-    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSON)
+    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSONB)
     error_message: Mapped[str | None] = mapped_column(Text)
 
     # Relationships
@@ -67,6 +82,7 @@ class TopicSeen(Base):
     source: Mapped[str] = mapped_column(String(100))  # arXiv, blog, github
     source_type: Mapped[str] = mapped_column(String(50))  # research, blog, release
     url: Mapped[str] = mapped_column(String(2000))
+    url_sha256: Mapped[bytes | None] = mapped_column(LargeBinary(32), unique=True)  # Dedupe key
     summary: Mapped[str | None] = mapped_column(Text)
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     discovered_at: Mapped[datetime] = mapped_column(
@@ -81,7 +97,7 @@ class TopicSeen(Base):
     combined_score: Mapped[float | None] = mapped_column(Float)
 
     # Embedding for semantic search
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(768))
+    embedding: Mapped[list[float] | None] = mapped_column(BinaryHALFVEC(768))
 
     # Relationship
     run: Mapped["AgentRun"] = relationship(back_populates="topics")
@@ -107,8 +123,8 @@ class AngleGenerated(Base):
     )
     stance: Mapped[str] = mapped_column(Text)  # The opinionated take
     why_it_matters: Mapped[str] = mapped_column(Text)
-    second_order_effects: Mapped[list[str]] = mapped_column(JSON)
-    relevant_for: Mapped[list[str]] = mapped_column(JSON)  # Audience segments
+    second_order_effects: Mapped[list[str]] = mapped_column(JSONB)
+    relevant_for: Mapped[list[str]] = mapped_column(JSONB)  # Audience segments
     confidence: Mapped[float] = mapped_column(Float)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -116,7 +132,7 @@ class AngleGenerated(Base):
     )
 
     # Embedding for redundancy check
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(768))
+    embedding: Mapped[list[float] | None] = mapped_column(BinaryHALFVEC(768))
 
     # Final selection flag
     is_selected: Mapped[bool] = mapped_column(default=False)
@@ -146,7 +162,7 @@ class AngleScore(Base):
         DateTime(timezone=True),
         server_default=func.now(),
     )
-    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSON)
+    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSONB)
 
     # Relationship
     angle: Mapped["AngleGenerated"] = relationship(back_populates="scores")
@@ -174,7 +190,7 @@ class RejectedItem(Base):
         DateTime(timezone=True),
         server_default=func.now(),
     )
-    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSON)
+    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSONB)
 
     # Relationship
     run: Mapped["AgentRun"] = relationship(back_populates="rejected_items")
@@ -200,8 +216,9 @@ class EmailSent(Base):
     )
     recipient: Mapped[str] = mapped_column(String(500))
     subject: Mapped[str] = mapped_column(String(500))
-    angle_ids: Mapped[list[str]] = mapped_column(JSON)  # UUIDs as strings
-    email_hash: Mapped[str | None] = mapped_column(String(64))  # Content hash
+    angle_ids: Mapped[list[str]] = mapped_column(JSONB)  # UUIDs as strings
+    # SHA-256 of content
+    email_hash: Mapped[bytes | None] = mapped_column(LargeBinary(32), unique=True)
     success: Mapped[bool] = mapped_column(default=True)
     error_message: Mapped[str | None] = mapped_column(Text)
 
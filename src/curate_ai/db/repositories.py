@@ -1,12 +1,17 @@
 """Repository layer for data access operations."""
 
+import hashlib
 import uuid
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
+from curate_ai.db.bulk import bulk_insert
 from curate_ai.db.models import (
     AgentRun,
     AngleGenerated,
@@ -58,7 +63,7 @@ class AgentRunRepository:
             .where(AgentRun.id == run_id)
             .values(
                 status=status,
-                completed_at=datetime.utcnow(),
+                completed_at=datetime.now(timezone.utc),
                 duration_seconds=duration_seconds,
                 error_message=error_message,
             )
@@ -74,6 +79,11 @@ class AgentRunRepository:
         return list(result.scalars().all())
 
 
+def _url_digest(url: str) -> bytes:
+    """SHA-256 digest of a URL, the unique dedupe key for topics."""
+    return hashlib.sha256(url.encode()).digest()
+
+
 class TopicRepository:
     """Repository for topic operations."""
 
@@ -97,6 +107,7 @@ class TopicRepository:
             source=source,
             source_type=source_type,
             url=url,
+            url_sha256=_url_digest(url),
             summary=summary,
             published_at=published_at,
         )
@@ -104,23 +115,40 @@ class TopicRepository:
         await self.session.flush()
         return topic
 
-    async def bulk_create(
-        self,
-        topics: list[dict[str, Any]],
-    ) -> list[TopicSeen]:
-        """Create multiple topics at once."""
-        created = []
-        for topic_data in topics:
-            topic = TopicSeen(**topic_data)
-            self.session.add(topic)
-            created.append(topic)
-        await self.session.flush()
-        return created
+    async def bulk_create(self, topics: list[dict[str, Any]]) -> set[str]:
+        """Create multiple topics, skipping seen URLs. Returns the URLs inserted."""
+        if not topics:
+            return set()
+        rows = [{**topic, "url_sha256": _url_digest(topic["url"])} for topic in topics]
+        result = await self.session.execute(
+            pg_insert(TopicSeen)
+            .on_conflict_do_nothing(index_elements=["url_sha256"])
+            .returning(TopicSeen.url),
+            rows,
+        )
+        return set(result.scalars().all())
+
+    async def release_urls(self, run_id: uuid.UUID) -> None:
+        """Clear the dedupe keys recorded by a run so later runs can retry its URLs."""
+        await self.session.execute(
+            update(TopicSeen)
+            .where(TopicSeen.run_id == run_id)
+            .values(url_sha256=None)
+        )
+
+    async def get_id_by_url(self, url: str) -> uuid.UUID | None:
+        """Check if a topic with this URL already exists, returning only its ID."""
+        result = await self.session.execute(
+            select(TopicSeen.id).where(TopicSeen.url_sha256 == _url_digest(url))
+        )
+        return result.scalar_one_or_none()
 
     async def get_by_url(self, url: str) -> TopicSeen | None:
-        """Check if a topic with this URL already exists."""
+        """Get the topic recorded for a URL, without loading its embedding."""
         result = await self.session.execute(
-            select(TopicSeen).where(TopicSeen.url == url)
+            select(TopicSeen)
+            .options(defer(TopicSeen.embedding))
+            .where(TopicSeen.url_sha256 == _url_digest(url))
         )
         return result.scalar_one_or_none()
 
@@ -156,28 +184,18 @@ class TopicRepository:
         limit: int = 5,
     ) -> list[TopicSeen]:
         """Find similar topics using vector similarity."""
-        # Using pgvector's <=> operator for cosine distance
+        # Embeddings are unit length, so pgvector's <#> (negative inner
+        # product) ranks exactly like cosine distance with less work, and the
+        # threshold is applied server-side as distance <= -threshold
+        distance = TopicSeen.embedding.max_inner_product(embedding)
         result = await self.session.execute(
             select(TopicSeen)
             .where(TopicSeen.embedding.isnot(None))
-            .order_by(TopicSeen.embedding.cosine_distance(embedding))
+            .where(distance <= -threshold)
+            .order_by(distance)
             .limit(limit)
         )
-        # Filter by threshold (cosine distance, so lower is more similar)
-        topics = list(result.scalars().all())
-        return [t for t in topics if self._cosine_similarity(t.embedding, embedding) >= threshold]
-
-    @staticmethod
-    def _cosine_similarity(a: list[float] | None, b: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        if a is None:
-            return 0.0
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot_product / (norm_a * norm_b)
+        return list(result.scalars().all())
 
 
 class AngleRepository:
@@ -212,8 +230,12 @@ class AngleRepository:
         await self.session.flush()
         return angle
 
-    async def mark_selected(self, angle_ids: list[uuid.UUID]) -> None:
-        """Mark angles as selected for the email."""
+    async def bulk_create(self, angles: list[dict[str, Any]]) -> None:
+        """Create multiple angles at once."""
+        await bulk_insert(self.session, AngleGenerated, angles)
+
+    async def mark_selected(self, angle_ids: Sequence[uuid.UUID]) -> None:
+        """Mark angles as selected for the email in one UPDATE statement."""
         await self.session.execute(
             update(AngleGenerated)
             .where(AngleGenerated.id.in_(angle_ids))
@@ -227,17 +249,56 @@ class AngleRepository:
         limit: int = 10,
     ) -> list[AngleGenerated]:
         """Find similar angles using vector similarity."""
+        distance = AngleGenerated.embedding.max_inner_product(embedding)
         result = await self.session.execute(
             select(AngleGenerated)
             .where(AngleGenerated.embedding.isnot(None))
-            .order_by(AngleGenerated.embedding.cosine_distance(embedding))
+            .where(distance <= -threshold)
+            .order_by(distance)
             .limit(limit)
         )
-        angles = list(result.scalars().all())
-        return [
-            a for a in angles
-            if TopicRepository._cosine_similarity(a.embedding, embedding) >= threshold
-        ]
+        return list(result.scalars().all())
+
+    async def get_max_similarities(
+        self,
+        embeddings: list[list[float]],
+        max_age_days: int | None = None,
+        ef_search: int = 40,
+    ) -> list[float]:
+        """Get each embedding's highest similarity to any stored angle in one round trip."""
+        if not embeddings:
+            return []
+        await self.session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+        # Keep scanning the index when the age filter discards candidates,
+        # instead of returning no neighbour once ef_search is exhausted.
+        # iterative_scan only exists from pgvector 0.8, so it is skipped on
+        # older extensions rather than failing the probe.
+        await self.session.execute(text(
+            "SELECT set_config('hnsw.iterative_scan', 'relaxed_order', true) "
+            "FROM pg_extension WHERE extname = 'vector' "
+            "AND string_to_array(extversion, '.')::int[] >= '{0,8}'"
+        ))
+
+        conditions = [AngleGenerated.embedding.isnot(None)]
+        if max_age_days is not None:
+            since = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            conditions.append(AngleGenerated.created_at >= since)
+
+        # One ORDER BY ... LIMIT 1 subquery per embedding, so each probe is
+        # still answered by the HNSW index but all of them share one statement
+        nearest = []
+        for embedding in embeddings:
+            distance = AngleGenerated.embedding.max_inner_product(embedding)
+            nearest.append(
+                select(distance)
+                .where(*conditions)
+                .order_by(distance)
+                .limit(1)
+                .scalar_subquery()
+            )
+        row = (await self.session.execute(select(*nearest))).one()
+        # <#> returns the negative inner product, i.e. -cosine for unit vectors
+        return [0.0 if distance is None else -distance for distance in row]
 
     async def add_score(
         self,
@@ -286,6 +347,10 @@ class RejectedItemRepository:
         await self.session.flush()
         return rejected
 
+    async def bulk_create(self, rejections: list[dict[str, Any]]) -> None:
+        """Create multiple rejection records at once."""
+        await bulk_insert(self.session, RejectedItem, rejections)
+
 
 class EmailRepository:
     """Repository for email records."""
@@ -299,7 +364,7 @@ class EmailRepository:
         recipient: str,
         subject: str,
         angle_ids: list[uuid.UUID],
-        email_hash: str | None = None,
+        email_hash: bytes | None = None,
     ) -> EmailSent:
         """Create an email sent record."""
         email = EmailSent(
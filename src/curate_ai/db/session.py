@@ -2,7 +2,10 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,6 +15,9 @@ from sqlalchemy.ext.asyncio import (
 
 from curate_ai.config import get_settings
 from curate_ai.db.models import Base
+from curate_ai.logging import get_logger
+
+logger = get_logger(__name__)
 
 # Global engine and session factory
 _engine: AsyncEngine | None = None
@@ -29,10 +35,27 @@ def get_engine() -> AsyncEngine:
             pool_pre_ping=True,
             pool_size=5,
             max_overflow=10,
+            insertmanyvalues_page_size=1000,
+            connect_args={
+                "prepared_statement_cache_size": 1024,
+                "server_settings": {"jit": "off"},
+            },
         )
+        event.listen(_engine.sync_engine, "connect", _register_vector_codecs)
     return _engine
 
 
+def _register_vector_codecs(dbapi_connection: Any, connection_record: Any) -> None:
+    """Install pgvector's binary codecs on a new asyncpg connection."""
+    try:
+        dbapi_connection.run_async(register_vector)
+    except ValueError as e:
+        # The vector extension does not exist yet (fresh database before
+        # init_db or migrations). Embeddings cannot be bound on this
+        # connection; init_db disposes the pool once the extension exists.
+        logger.warning("pgvector codecs not registered on connection", error=str(e))
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -73,6 +96,9 @@ async def init_db() -> None:
         from sqlalchemy import text
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.run_sync(Base.metadata.create_all)
+    # Connections opened before the extension existed carry no vector
+    # codecs; drop them so every new connection registers the codecs
+    await engine.dispose()
 
 
 async def close_db() -> None:
@@ -1,11 +1,27 @@
 """Ingestion module for Curate AI - handles all data source collection."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from curate_ai.ingestion.base import IngestionResult, SourceConfig
-from curate_ai.ingestion.manager import IngestionManager, ingest_all_sources
-from curate_ai.ingestion.rss_scraper import RSSscraper
-from curate_ai.ingestion.reddit import RedditScraper
-from curate_ai.ingestion.web_search import WebSearcher
-from curate_ai.ingestion.arxiv import ArxivFetcher
+
+if TYPE_CHECKING:
+    from curate_ai.ingestion.arxiv import ArxivFetcher
+    from curate_ai.ingestion.manager import IngestionManager, ingest_all_sources
+    from curate_ai.ingestion.reddit import RedditScraper
+    from curate_ai.ingestion.rss_scraper import RSSscraper
+    from curate_ai.ingestion.web_search import WebSearcher
+
+# Backends are imported on first access (PEP 562) so importing one source,
+# or just the base types, does not pull in every scraper's dependencies
+_LAZY_IMPORTS = {
+    "IngestionManager": "curate_ai.ingestion.manager",
+    "ingest_all_sources": "curate_ai.ingestion.manager",
+    "RSSscraper": "curate_ai.ingestion.rss_scraper",
+    "RedditScraper": "curate_ai.ingestion.reddit",
+    "WebSearcher": "curate_ai.ingestion.web_search",
+    "ArxivFetcher": "curate_ai.ingestion.arxiv",
+}
 
 __all__ = [
     "IngestionResult",
@@ -17,3 +33,12 @@ __all__ = [
     "WebSearcher",
     "ArxivFetcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
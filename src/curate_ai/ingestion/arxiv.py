@@ -1,111 +1,181 @@
 """arXiv API scraper for the ingestion module."""
 
+import asyncio
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-import feedparser
 import httpx
 
-from curate_ai.ingestion.base import BaseScraper, IngestionResult, SourceConfig
-from curate_ai.logging import get_logger
+from curate_ai.ingestion.base import (
+    STREAM_CHUNK_SIZE,
+    BaseScraper,
+    IngestionResult,
+    SourceConfig,
+    retry_throttled,
+)
+from curate_ai.logging import debug_enabled, get_logger
 
 logger = get_logger(__name__)
 
+# Namespaces used by the arXiv Atom API
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+
+
+def _parse_entry(entry: ET.Element, published: datetime) -> IngestionResult:
+    """Build an IngestionResult from a single arXiv Atom <entry> element."""
+    entry_id = entry.findtext(f"{_ATOM}id", "")
+    
+    # The abstract page is the alternate link; the PDF link is typed
+    url = entry_id
+    pdf_link = None
+    for link in entry.iterfind(f"{_ATOM}link"):
+        if link.get("type") == "application/pdf":
+            pdf_link = link.get("href")
+        elif link.get("rel", "alternate") == "alternate":
+            url = link.get("href", url)
+    
+    primary = entry.find(f"{_ARXIV}primary_category")
+    
+    return IngestionResult(
+        title=entry.findtext(f"{_ATOM}title", "").replace("\n", " ").strip(),
+        url=url,
+        source="arXiv",
+        source_type="arxiv",
+        category="research",
+        summary=entry.findtext(f"{_ATOM}summary", "").replace("\n", " ").strip()[:1500],
+        published_at=published,
+        authors=[
+            name.strip()
+            for name in (
+                author.findtext(f"{_ATOM}name", "") for author in entry.iterfind(f"{_ATOM}author")
+            )
+            if name.strip()
+        ],
+        tags=[tag.get("term", "") for tag in entry.iterfind(f"{_ATOM}category")],
+        metadata={
+            "primary_category": primary.get("term", "") if primary is not None else "",
+            "pdf_url": pdf_link or url,
+            "arxiv_id": entry_id.split("/abs/")[-1] if "/abs/" in entry_id else entry_id,
+        },
+    )
+
 
 class ArxivFetcher(BaseScraper):
     """Fetcher for arXiv research papers."""
     
     API_URL = "https://export.arxiv.org/api/query"
     
-    def __init__(self, config: SourceConfig):
-        super().__init__(config)
+    def __init__(self, config: SourceConfig, client: httpx.AsyncClient | None = None):
+        super().__init__(config, client)
         self.arxiv_config = config.arxiv
+        
+        # Query parameters are fixed by config, so build them once per category
+        max_results = self.arxiv_config.get("max_results", 50)
+        self.category_params: dict[str, dict[str, Any]] = {
+            category: {
+                "search_query": f"cat:{category}",
+                "sortBy": "submittedDate",
+                "sortOrder": "descending",
+                "start": 0,
+                "max_results": max_results,
+            }
+            for category in self.arxiv_config.get("categories", ["cs.AI", "cs.LG", "cs.CL"])
+        }
     
     async def fetch(self, days_back: int | None = None) -> list[IngestionResult]:
-        """Fetch papers from arXiv API."""
+        """Fetch papers from arXiv API, querying each category concurrently."""
         if not self.arxiv_config.get("enabled", True):
             logger.info("arXiv disabled")
             return []
         
-        categories = self.arxiv_config.get("categories", ["cs.AI", "cs.LG", "cs.CL"])
-        max_results = self.arxiv_config.get("max_results", 50)
-        
         if days_back is None:
             days_back = self.arxiv_config.get("days_lookback", 3)
         
-        # Build query
-        cat_query = " OR ".join(f"cat:{cat}" for cat in categories)
-        
-        params = {
-            "search_query": cat_query,
-            "sortBy": "submittedDate",
-            "sortOrder": "descending",
-            "start": 0,
-            "max_results": max_results,
-        }
-        
-        try:
-            async with httpx.AsyncClient(
-                timeout=self.get_timeout(),
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(self.API_URL, params=params)
-                response.raise_for_status()
-        except Exception as e:
-            logger.error("arXiv API failed", error=str(e))
-            return []
-        
-        # Parse Atom feed
-        feed = feedparser.parse(response.text)
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         
+        # One query per category, so each gets its own max_results budget;
+        # the semaphore keeps concurrent requests within arXiv's usage policy
+        semaphore = asyncio.Semaphore(self.arxiv_config.get("max_concurrent_queries", 3))
+        async with self.session():
+            batches = await asyncio.gather(
+                *(
+                    self._fetch_category(category, params, cutoff_date, semaphore)
+                    for category, params in self.category_params.items()
+                ),
+                return_exceptions=True,
+            )
+        
+        # Cross-listed papers are returned once per category
         results = []
-        for entry in feed.entries:
-            # Parse publication date
-            try:
-                published = datetime.fromisoformat(
-                    entry.published.replace("Z", "+00:00")
-                )
-                if published < cutoff_date:
-                    continue
-            except (AttributeError, ValueError):
+        seen_ids: set[str] = set()
+        for category, batch in zip(self.category_params, batches, strict=True):
+            if isinstance(batch, BaseException):
+                logger.error("arXiv API failed", category=category, error=str(batch))
                 continue
-            
-            # Extract primary category
-            primary_cat = entry.get("arxiv_primary_category", {}).get("term", "")
-            
-            # Extract all categories
-            categories = [tag.term for tag in entry.get("tags", [])]
-            
-            # Extract authors
-            authors = [author.name for author in entry.get("authors", [])]
-            
-            # Clean title and summary
-            title = entry.title.replace("\n", " ").strip()
-            summary = entry.summary.replace("\n", " ").strip()
-            
-            # Get PDF link
-            pdf_link = entry.link
-            for link in entry.get("links", []):
-                if link.get("type") == "application/pdf":
-                    pdf_link = link.get("href", entry.link)
-                    break
-            
-            results.append(IngestionResult(
-                title=title,
-                url=entry.link,
-                source="arXiv",
-                source_type="arxiv",
-                category="research",
-                summary=summary[:1500],
-                published_at=published,
-                authors=authors,
-                tags=categories,
-                metadata={
-                    "primary_category": primary_cat,
-                    "pdf_url": pdf_link,
-                    "arxiv_id": entry.id.split("/abs/")[-1] if "/abs/" in entry.id else entry.id,
-                },
-            ))
+            for result in batch:
+                arxiv_id = result.metadata["arxiv_id"]
+                if arxiv_id not in seen_ids:
+                    seen_ids.add(arxiv_id)
+                    results.append(result)
+        
+        logger.info(
+            "arXiv fetch completed",
+            count=len(results),
+            categories=len(self.category_params),
+        )
+        return results
+    
+    @retry_throttled
+    async def _query(self, params: dict[str, Any], cutoff_date: datetime) -> list[IngestionResult]:
+        """
+        Run one API query, parsing entries as the response streams in.
+        
+        Chunks are fed to an incremental XML parser and each <entry> is
+        converted and cleared as soon as it closes, so the response is never
+        buffered whole. Results are sorted newest first, so the download
+        stops at the first entry older than the cutoff. Backs off
+        exponentially while throttled.
+        """
+        parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("end",))
+        results: list[IngestionResult] = []
+        async with self._client_context() as client:
+            async with client.stream(
+                "GET", self.API_URL, params=params, timeout=self.get_timeout()
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    for event in parser.read_events():
+                        # Only "end" events are requested, so each one ends
+                        # with its element
+                        elem = event[-1]
+                        if not isinstance(elem, ET.Element) or elem.tag != f"{_ATOM}entry":
+                            continue
+                        published_text = elem.findtext(f"{_ATOM}published")
+                        if published_text:
+                            published = datetime.fromisoformat(
+                                published_text.replace("Z", "+00:00")
+                            )
+                            if published < cutoff_date:
+                                return results
+                            results.append(_parse_entry(elem, published))
+                        elem.clear()
+        parser.close()
+        return results
+    
+    async def _fetch_category(
+        self,
+        category: str,
+        params: dict[str, Any],
+        cutoff_date: datetime,
+        semaphore: asyncio.Semaphore,
+    ) -> list[IngestionResult]:
+        """Fetch the most recent papers in a single category."""
+        async with semaphore:
+            results = await self._query(params, cutoff_date)
         
-        logger.info("arXiv fetch completed", count=len(results), categories=len(categories))
+        if debug_enabled(__name__):
+            logger.debug("Fetched arXiv category", category=category, count=len(results))
         return results
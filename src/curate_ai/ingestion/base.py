@@ -1,19 +1,73 @@
 """Base classes and schemas for the ingestion module."""
 
+import asyncio
+import copy
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+from urllib.parse import urlsplit, urlunsplit
 
+import httpx
 import yaml
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from curate_ai.logging import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml's C loader when PyYAML was built against it, else the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+T = TypeVar("T")
+
+# Query parameters that only track where a click came from
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Dedupe key for a URL.
+    
+    Scheme and host are lower-cased, and default ports, tracking parameters
+    (utm_*, fbclid, ...), the fragment and trailing slashes are dropped, so
+    links to the same page from different sources compare equal. Remaining
+    query parameters keep their original order and encoding.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        # Malformed netloc or port; fall back to the plain string
+        base, _, _ = url.partition("#")
+        return base.rstrip("/")
+    
+    netloc = parts.hostname or ""
+    if port is not None and port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        netloc = f"{netloc}:{port}"
+    
+    query = parts.query
+    if query:
+        query = "&".join(
+            param for param in query.split("&")
+            if param and not _is_tracking_param(param.partition("=")[0])
+        )
+    
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path.rstrip("/"), query, ""))
+
+
+def _is_tracking_param(name: str) -> bool:
+    """Whether a query parameter name is a click-tracking parameter."""
+    name = name.lower()
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
+
+@dataclass(slots=True)
 class IngestionResult:
     """Result from an ingestion source."""
     
@@ -30,7 +84,19 @@ class IngestionResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime: float) -> dict[str, Any]:
+    """Parse a YAML file; keyed on mtime so edits to the file are picked up."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def _read_yaml(path: str, mtime: float) -> dict[str, Any]:
+    """Read a parsed YAML file as a private copy, so callers cannot mutate the cache."""
+    return copy.deepcopy(_parse_yaml(path, mtime))
+
+
+@dataclass(slots=True)
 class SourceConfig:
     """Configuration for data sources loaded from YAML."""
     
@@ -53,8 +119,7 @@ class SourceConfig:
             logger.warning("Config file not found, using defaults", path=str(config_path))
             return cls()
         
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_yaml(str(config_path.resolve()), config_path.stat().st_mtime)
         
         return cls(
             rss_feeds=data.get("rss_feeds", []),
@@ -65,12 +130,58 @@ class SourceConfig:
         )
 
 
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; CurateAI/1.0)"
+
+# Read size when streaming response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Statuses that signal rate limiting or a transient server failure
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether a request failed with a status worth retrying after a backoff."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in RETRYABLE_STATUSES
+    )
+
+
+# Exponential backoff for throttled or transiently failing requests
+retry_throttled = retry(
+    retry=retry_if_exception(is_retryable),
+    stop=stop_after_attempt(4),
+    wait=wait_exponential(min=1, max=30),
+    reraise=True,
+)
+
+
+def build_http_client(settings: dict[str, Any]) -> httpx.AsyncClient:
+    """
+    Build an HTTP/2 client for scrapers from the `settings` section of sources.yml.
+    
+    One client is meant to be shared by every scraper in a run, so repeat
+    requests to a host reuse a pooled connection instead of paying a fresh
+    TCP + TLS handshake, and same-host requests multiplex over HTTP/2.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(settings.get("request_timeout", 30)),
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        headers={"User-Agent": settings.get("user_agent", DEFAULT_USER_AGENT)},
+    )
+
+
 class BaseScraper(ABC):
     """Base class for all scrapers."""
     
-    def __init__(self, config: SourceConfig):
+    def __init__(self, config: SourceConfig, client: httpx.AsyncClient | None = None):
         self.config = config
         self.settings = config.settings
+        self.client = client
+        # Open session() blocks sharing a client this scraper created itself
+        self._session_users = 0
     
     @abstractmethod
     async def fetch(self, days_back: int = 3) -> list[IngestionResult]:
@@ -83,4 +194,81 @@ class BaseScraper(ABC):
     
     def get_user_agent(self) -> str:
         """Get user agent from config."""
-        return self.settings.get("user_agent", "Mozilla/5.0 (compatible; CurateAI/1.0)")
+        return self.settings.get("user_agent", DEFAULT_USER_AGENT)
+    
+    def get_max_concurrency(self) -> int:
+        """Get the cap on in-flight requests per scraper from config."""
+        return self.settings.get("max_concurrent_requests", 10)
+    
+    async def gather_bounded(self, aws: Iterable[Awaitable[T]]) -> list[T]:
+        """Await all of aws concurrently, at most get_max_concurrency() at a time."""
+        semaphore = asyncio.Semaphore(self.get_max_concurrency())
+        
+        async def guarded(aw: Awaitable[T]) -> T:
+            async with semaphore:
+                return await aw
+        
+        async with self.session():
+            return await asyncio.gather(*(guarded(aw) for aw in aws))
+    
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[None]:
+        """
+        Share one client across every request made inside the block.
+        
+        Scrapers given a client at construction already share it. Standalone
+        scrapers open one client for the block, closed when the last
+        (possibly concurrent) block exits, instead of one per request.
+        """
+        if self.client is not None and not self._session_users:
+            yield
+            return
+        
+        if not self._session_users:
+            self.client = build_http_client(self.settings)
+        self._session_users += 1
+        try:
+            yield
+        finally:
+            self._session_users -= 1
+            if not self._session_users:
+                client, self.client = self.client, None
+                if client is not None:
+                    await client.aclose()
+    
+    @asynccontextmanager
+    async def _client_context(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yield the shared client.
+        
+        Scrapers used standalone outside a session() block fall back to a
+        short-lived client for the request.
+        """
+        if self.client is not None:
+            yield self.client
+        else:
+            async with build_http_client(self.settings) as client:
+                yield client
+    
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared client."""
+        kwargs.setdefault("timeout", self.get_timeout())
+        async with self._client_context() as client:
+            return await client.request(method, url, **kwargs)
+    
+    async def fetch_bytes(self, method: str, url: str, **kwargs: Any) -> bytes:
+        """
+        Stream a response body as raw bytes, raising for HTTP error statuses.
+        
+        Feeds are handed to feedparser undecoded, so it sniffs the encoding
+        from the XML prolog itself and no decoded str copy of the body is
+        ever built.
+        """
+        kwargs.setdefault("timeout", self.get_timeout())
+        body = bytearray()
+        async with self._client_context() as client:
+            async with client.stream(method, url, **kwargs) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    body += chunk
+        return bytes(body)
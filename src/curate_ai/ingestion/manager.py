@@ -5,7 +5,12 @@ from datetime import datetime, timezone
 
 from curate_ai.agents.schemas import TopicCandidate
 from curate_ai.ingestion.arxiv import ArxivFetcher
-from curate_ai.ingestion.base import IngestionResult, SourceConfig
+from curate_ai.ingestion.base import (
+    IngestionResult,
+    SourceConfig,
+    build_http_client,
+    canonical_url,
+)
 from curate_ai.ingestion.reddit import RedditScraper
 from curate_ai.ingestion.rss_scraper import RSSscraper
 from curate_ai.ingestion.web_search import WebSearcher
@@ -20,11 +25,24 @@ class IngestionManager:
     def __init__(self, config_path: str | None = None):
         self.config = SourceConfig.load(config_path)
         
+        # One pooled HTTP/2 client shared by every scraper
+        self.client = build_http_client(self.config.settings)
+        
         # Initialize all scrapers
-        self.rss_scraper = RSSscraper(self.config)
-        self.reddit_scraper = RedditScraper(self.config)
-        self.web_searcher = WebSearcher(self.config)
-        self.arxiv_fetcher = ArxivFetcher(self.config)
+        self.rss_scraper = RSSscraper(self.config, self.client)
+        self.reddit_scraper = RedditScraper(self.config, self.client)
+        self.web_searcher = WebSearcher(self.config, self.client)
+        self.arxiv_fetcher = ArxivFetcher(self.config, self.client)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self.client.aclose()
+    
+    async def __aenter__(self) -> "IngestionManager":
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
     
     async def ingest_all(self, days_back: int | None = None) -> list[IngestionResult]:
         """
@@ -42,43 +60,37 @@ class IngestionManager:
         logger.info("Starting ingestion", days_back=days_back)
         
         # Run all scrapers concurrently
-        tasks = [
-            self.rss_scraper.fetch(days_back),
-            self.reddit_scraper.fetch(days_back),
-            self.web_searcher.fetch(days_back),
-            self.arxiv_fetcher.fetch(days_back),
-        ]
+        sources = {
+            "RSS": self.rss_scraper.fetch(days_back),
+            "Reddit": self.reddit_scraper.fetch(days_back),
+            "Web Search": self.web_searcher.fetch(days_back),
+            "arXiv": self.arxiv_fetcher.fetch(days_back),
+        }
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*sources.values(), return_exceptions=True)
         
-        # Collect all results, handling exceptions
-        all_results: list[IngestionResult] = []
-        source_names = ["RSS", "Reddit", "Web Search", "arXiv"]
+        # Deduplicate by canonical URL, merging in source order so the first
+        # source listed above wins regardless of which scraper finished first
+        unique: dict[str, IngestionResult] = {}
+        total_raw = 0
         
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"{source_names[i]} scraper failed", error=str(result))
-            else:
-                all_results.extend(result)
-                logger.info(f"{source_names[i]} returned {len(result)} items")
-        
-        # Deduplicate by URL
-        seen_urls: set[str] = set()
-        unique_results: list[IngestionResult] = []
-        
-        for item in all_results:
-            # Normalize URL (remove trailing slashes, fragments)
-            url = item.url.rstrip("/").split("#")[0]
+        for name, result in zip(sources, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"{name} scraper failed", error=str(result))
+                continue
             
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(item)
+            logger.info(f"{name} returned {len(result)} items")
+            total_raw += len(result)
+            for item in result:
+                unique.setdefault(canonical_url(item.url), item)
+        
+        unique_results = list(unique.values())
         
         logger.info(
             "Ingestion complete",
-            total_raw=len(all_results),
+            total_raw=total_raw,
             unique=len(unique_results),
-            duplicates_removed=len(all_results) - len(unique_results),
+            duplicates_removed=total_raw - len(unique_results),
         )
         
         return unique_results
@@ -91,9 +103,10 @@ class IngestionManager:
         """
         results = await self.ingest_all(days_back)
         
-        topics: list[TopicCandidate] = []
-        for item in results:
-            topics.append(TopicCandidate(
+        # Scrapers build IngestionResults with already-typed fields, so the
+        # candidates are constructed without re-running validation
+        return [
+            TopicCandidate.model_construct(
                 title=item.title,
                 source=item.source,
                 source_type=item.source_type,
@@ -102,9 +115,9 @@ class IngestionManager:
                 published_at=item.published_at,
                 authors=item.authors,
                 tags=item.tags,
-            ))
-        
-        return topics
+            )
+            for item in results
+        ]
 
 
 async def ingest_all_sources(
@@ -121,5 +134,5 @@ async def ingest_all_sources(
     Returns:
         List of TopicCandidate objects
     """
-    manager = IngestionManager(config_path)
-    return await manager.ingest_to_topics(days_back)
+    async with IngestionManager(config_path) as manager:
+        return await manager.ingest_to_topics(days_back)
@@ -1,12 +1,16 @@
 """Reddit scraper for the ingestion module."""
 
-import asyncio
 from datetime import datetime, timedelta, timezone
 
 import httpx
 
-from curate_ai.ingestion.base import BaseScraper, IngestionResult, SourceConfig
-from curate_ai.logging import get_logger
+from curate_ai.ingestion.base import (
+    BaseScraper,
+    IngestionResult,
+    SourceConfig,
+    retry_throttled,
+)
+from curate_ai.logging import debug_enabled, get_logger
 
 logger = get_logger(__name__)
 
@@ -17,8 +21,8 @@ class RedditScraper(BaseScraper):
     # Reddit's public JSON API (no auth required for public subreddits)
     BASE_URL = "https://www.reddit.com"
     
-    def __init__(self, config: SourceConfig):
-        super().__init__(config)
+    def __init__(self, config: SourceConfig, client: httpx.AsyncClient | None = None):
+        super().__init__(config, client)
         self.subreddits = config.subreddits
     
     async def fetch(self, days_back: int = 3) -> list[IngestionResult]:
@@ -27,11 +31,14 @@ class RedditScraper(BaseScraper):
             logger.info("No subreddits configured")
             return []
         
-        tasks = [
-            self._fetch_subreddit(sub, days_back)
+        # Compared against Reddit's float created_utc, so no datetime is
+        # built for posts that fall outside the window
+        cutoff_epoch = (datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp()
+        # Bounded to stay under Reddit's rate limit
+        results = await self.gather_bounded(
+            self._fetch_subreddit(sub, cutoff_epoch)
             for sub in self.subreddits
-        ]
-        results = await asyncio.gather(*tasks)
+        )
         
         # Flatten and sort by score
         all_results = []
@@ -44,10 +51,24 @@ class RedditScraper(BaseScraper):
         logger.info("Reddit scraper completed", total_items=len(all_results), subreddits=len(self.subreddits))
         return all_results
     
+    @retry_throttled
+    async def _get_listing(self, url: str, limit: int) -> dict:
+        """Get a subreddit listing, backing off on rate limiting and server errors."""
+        response = await self.request(
+            "GET",
+            url,
+            params={"limit": limit, "raw_json": 1},
+            headers={
+                "User-Agent": self.get_user_agent(),
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+    
     async def _fetch_subreddit(
         self,
         sub_config: dict,
-        days_back: int
+        cutoff_epoch: float
     ) -> list[IngestionResult]:
         """Fetch posts from a single subreddit."""
         subreddit = sub_config.get("subreddit", "")
@@ -61,43 +82,31 @@ class RedditScraper(BaseScraper):
         url = f"{self.BASE_URL}/r/{subreddit}/{sort}.json"
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.get_timeout(),
-                follow_redirects=True
-            ) as client:
-                response = await client.get(
-                    url,
-                    params={"limit": limit, "raw_json": 1},
-                    headers={
-                        "User-Agent": self.get_user_agent(),
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
+            data = await self._get_listing(url, limit)
         except Exception as e:
             logger.warning("Failed to fetch subreddit", subreddit=subreddit, error=str(e))
             return []
         
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         results = []
         
         posts = data.get("data", {}).get("children", [])
         for post in posts:
             post_data = post.get("data", {})
             
-            # Parse creation date
+            # Skip old posts before building any datetime
             created_utc = post_data.get("created_utc", 0)
-            if created_utc:
-                published = datetime.fromtimestamp(created_utc, tz=timezone.utc)
-                if published < cutoff_date:
-                    continue
-            else:
-                published = None
+            if created_utc and created_utc < cutoff_epoch:
+                continue
             
             # Skip stickied posts (usually mod announcements)
             if post_data.get("stickied", False):
                 continue
             
+            # Parse creation date
+            published = (
+                datetime.fromtimestamp(created_utc, tz=timezone.utc) if created_utc else None
+            )
+            
             # Get post URL (prefer external link over reddit post)
             post_url = post_data.get("url", "")
             is_self = post_data.get("is_self", False)
@@ -112,6 +121,8 @@ class RedditScraper(BaseScraper):
             
             # Extract score and engagement
             score = post_data.get("score", 0)
+            author = post_data.get("author")
+            flair = post_data.get("link_flair_text")
             num_comments = post_data.get("num_comments", 0)
             
             results.append(IngestionResult(
@@ -122,8 +133,8 @@ class RedditScraper(BaseScraper):
                 category="discussion",
                 summary=selftext or f"Reddit post with {num_comments} comments",
                 published_at=published,
-                authors=[post_data.get("author", "")],
-                tags=[post_data.get("link_flair_text", "")] if post_data.get("link_flair_text") else [],
+                authors=[author] if author else [],
+                tags=[flair] if flair else [],
                 score=float(score),
                 metadata={
                     "subreddit": subreddit,
@@ -134,5 +145,6 @@ class RedditScraper(BaseScraper):
                 },
             ))
         
-        logger.debug("Fetched subreddit", subreddit=subreddit, count=len(results))
+        if debug_enabled(__name__):
+            logger.debug("Fetched subreddit", subreddit=subreddit, count=len(results))
         return results
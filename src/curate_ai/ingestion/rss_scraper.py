@@ -1,23 +1,129 @@
 """RSS/Atom feed scraper for the ingestion module."""
 
-import asyncio
+import html
+import io
 import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
 
 import feedparser
 import httpx
 
-from curate_ai.ingestion.base import BaseScraper, IngestionResult, SourceConfig
-from curate_ai.logging import get_logger
+from curate_ai.ingestion.base import (
+    BaseScraper,
+    IngestionResult,
+    SourceConfig,
+    retry_throttled,
+)
+from curate_ai.logging import debug_enabled, get_logger
 
 logger = get_logger(__name__)
 
+# Entry elements: RSS 2.0 / RSS 1.0 <item> and Atom <entry>
+_ENTRY_TAGS = frozenset({"item", "entry"})
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an ElementTree tag."""
+    return tag.rpartition("}")[2]
+
+
+def _parse_feed_date(text: str | None) -> datetime | None:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date as a UTC datetime."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _clean_summary(summary: str) -> str:
+    """Strip HTML tags, entities and extra whitespace from a summary."""
+    # Plain-text summaries skip the tag pass entirely
+    if "<" in summary:
+        summary = _TAG_RE.sub("", summary)
+    summary = html.unescape(summary)
+    return _WHITESPACE_RE.sub(" ", summary).strip()[:1000]  # Limit length
+
+
+def _iterparse_entries(content: bytes) -> Iterator[dict[str, Any]]:
+    """
+    Incrementally parse RSS/Atom entries with the C-accelerated expat parser.
+    
+    Only the fields needed for an IngestionResult are read, and each entry
+    element is cleared once handled so the full document tree is never held.
+    
+    Raises:
+        xml.etree.ElementTree.ParseError: If the feed is not well-formed XML
+    """
+    for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if _local_name(elem.tag) not in _ENTRY_TAGS:
+            continue
+
+        fields: dict[str, str] = {}
+        link = ""
+        authors: list[str] = []
+        tags: list[str] = []
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == "link":
+                # Atom links are attributes; RSS links are element text
+                href = child.get("href")
+                if href is None:
+                    link = link or (child.text or "").strip()
+                elif not link and child.get("rel", "alternate") == "alternate":
+                    link = href
+            elif name in ("author", "creator"):
+                author_name = child.findtext("{*}name") or child.text or ""
+                if author_name.strip():
+                    authors.append(author_name.strip())
+            elif name == "category":
+                term = child.get("term") or child.text or ""
+                if term.strip():
+                    tags.append(term.strip())
+            else:
+                fields.setdefault(name, "".join(child.itertext()))
+
+        yield {
+            "title": fields.get("title", "Untitled").strip(),
+            "link": link,
+            "summary": (
+                fields.get("summary")
+                or fields.get("description")
+                or fields.get("content")
+                or fields.get("encoded", "")
+            ),
+            "published": _parse_feed_date(
+                fields.get("published")
+                or fields.get("pubDate")
+                or fields.get("date")
+                or fields.get("updated")
+            ),
+            "authors": authors,
+            "tags": tags,
+        }
+        elem.clear()
+
 
 class RSSscraper(BaseScraper):
     """Scraper for RSS and Atom feeds."""
     
-    def __init__(self, config: SourceConfig):
-        super().__init__(config)
+    def __init__(self, config: SourceConfig, client: httpx.AsyncClient | None = None):
+        super().__init__(config, client)
         self.feeds = config.rss_feeds
     
     async def fetch(self, days_back: int = 3) -> list[IngestionResult]:
@@ -26,11 +132,13 @@ class RSSscraper(BaseScraper):
             logger.info("No RSS feeds configured")
             return []
         
-        tasks = [
-            self._fetch_feed(feed, days_back) 
+        # Computed once and shared by every feed
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        # Bounded so a long feed list does not open every connection at once
+        results = await self.gather_bounded(
+            self._fetch_feed(feed, cutoff_date)
             for feed in self.feeds
-        ]
-        results = await asyncio.gather(*tasks)
+        )
         
         # Flatten results
         all_results = []
@@ -43,7 +151,7 @@ class RSSscraper(BaseScraper):
     async def _fetch_feed(
         self, 
         feed_config: dict, 
-        days_back: int
+        cutoff_date: datetime
     ) -> list[IngestionResult]:
         """Fetch a single RSS feed."""
         name = feed_config.get("name", "Unknown")
@@ -54,56 +162,74 @@ class RSSscraper(BaseScraper):
             return []
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.get_timeout(),
-                follow_redirects=True
-            ) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": self.get_user_agent()}
-                )
-                response.raise_for_status()
+            content = await self._download(url)
         except Exception as e:
             logger.warning("Failed to fetch RSS feed", source=name, error=str(e))
             return []
         
-        # Parse feed
-        feed = feedparser.parse(response.text)
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        # Parse feed, falling back to feedparser's lenient parser for
+        # feeds that are not well-formed XML
+        try:
+            entries = list(_iterparse_entries(content))
+        except ET.ParseError:
+            entries = self._feedparser_entries(content)
         
         results = []
-        for entry in feed.entries:
-            # Parse publication date
-            published = self._parse_date(entry)
+        for entry in entries:
+            published = entry["published"]
             
             # Skip if too old
             if published and published < cutoff_date:
                 continue
             
-            # Extract and clean summary
-            summary = self._extract_summary(entry)
-            
             # Get URL
-            entry_url = entry.get("link", "")
+            entry_url = entry["link"]
             if not entry_url:
                 continue
             
             results.append(IngestionResult(
-                title=entry.get("title", "Untitled").strip(),
+                title=entry["title"],
                 url=entry_url,
                 source=name,
                 source_type="rss",
                 category=category,
-                summary=summary,
+                summary=_clean_summary(entry["summary"]),
                 published_at=published,
-                authors=self._extract_authors(entry),
-                tags=self._extract_tags(entry),
+                authors=entry["authors"],
+                tags=entry["tags"],
                 metadata={"feed_url": url},
             ))
         
-        logger.debug("Fetched RSS feed", source=name, count=len(results))
+        if debug_enabled(__name__):
+            logger.debug("Fetched RSS feed", source=name, count=len(results))
         return results
     
+    @retry_throttled
+    async def _download(self, url: str) -> bytes:
+        """Download a feed, backing off on rate limiting and server errors."""
+        return await self.fetch_bytes(
+            "GET",
+            url,
+            headers={"User-Agent": self.get_user_agent()},
+        )
+    
+    def _feedparser_entries(self, content: bytes) -> list[dict[str, Any]]:
+        """Parse entries with feedparser into the same shape as _iterparse_entries."""
+        # Summaries are reduced to plain text by _clean_summary, so
+        # feedparser's own HTML sanitizing and URI resolution are wasted work
+        feed = feedparser.parse(content, sanitize_html=False, resolve_relative_uris=False)
+        return [
+            {
+                "title": entry.get("title", "Untitled").strip(),
+                "link": entry.get("link", ""),
+                "summary": self._extract_summary(entry),
+                "published": self._parse_date(entry),
+                "authors": self._extract_authors(entry),
+                "tags": self._extract_tags(entry),
+            }
+            for entry in feed.entries
+        ]
+    
     def _parse_date(self, entry) -> datetime | None:
         """Parse publication date from feed entry."""
         if hasattr(entry, "published_parsed") and entry.published_parsed:
@@ -121,7 +247,7 @@ class RSSscraper(BaseScraper):
         return None
     
     def _extract_summary(self, entry) -> str:
-        """Extract and clean summary from feed entry."""
+        """Extract the raw summary from feed entry."""
         summary = ""
         if hasattr(entry, "summary"):
             summary = entry.summary
@@ -130,12 +256,7 @@ class RSSscraper(BaseScraper):
         elif hasattr(entry, "content") and entry.content:
             summary = entry.content[0].get("value", "")
         
-        # Clean HTML tags
-        summary = re.sub(r'<[^>]+>', '', summary)
-        # Clean extra whitespace
-        summary = re.sub(r'\s+', ' ', summary).strip()
-        
-        return summary[:1000]  # Limit length
+        return summary
     
     def _extract_authors(self, entry) -> list[str]:
         """Extract authors from feed entry."""
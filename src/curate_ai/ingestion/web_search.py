@@ -1,18 +1,65 @@
 """Web search scraper for the ingestion module."""
 
+import asyncio
+import html
+import re
 from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
 
-from curate_ai.ingestion.base import BaseScraper, IngestionResult, SourceConfig
-from curate_ai.logging import get_logger
+import httpx
+
+from curate_ai.ingestion.base import (
+    BaseScraper,
+    IngestionResult,
+    SourceConfig,
+    canonical_url,
+)
+from curate_ai.logging import debug_enabled, get_logger
 
 logger = get_logger(__name__)
 
+# DuckDuckGo HTML format: each result block has <a class="result__a" href="...">title</a>
+# followed by an optional <a class="result__snippet">snippet</a>. One alternation
+# matches both, so a single scan sees them in document order.
+_RESULT_ANCHOR_RE = re.compile(
+    r'<a\b([^>]*\bclass="result__(a|snippet)"[^>]*)>(.*?)</a>',
+    re.DOTALL,
+)
+_HREF_RE = re.compile(r'\bhref="([^"]*)"')
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _anchor_text(inner_html: str) -> str:
+    """Plain text of an anchor's inner HTML (snippets contain <b> highlights)."""
+    return html.unescape(_TAG_RE.sub("", inner_html)).strip()
+
+
+def _parse_results(page: str, max_results: int) -> list[tuple[str, str, str]]:
+    """
+    Extract (href, title, snippet) for the first max_results result links.
+    
+    Each snippet is paired with the link it follows in the page, so a result
+    without a snippet does not shift the snippets of the results after it.
+    """
+    results: list[list[str]] = []
+    for match in _RESULT_ANCHOR_RE.finditer(page):
+        attrs, kind, inner = match.groups()
+        if kind == "a":
+            if len(results) == max_results:
+                break
+            href = _HREF_RE.search(attrs)
+            url = html.unescape(href.group(1)) if href else ""
+            results.append([url, _anchor_text(inner), ""])
+        elif results and not results[-1][2]:
+            results[-1][2] = _anchor_text(inner)
+    return [(href, title, snippet) for href, title, snippet in results]
+
 
 class WebSearcher(BaseScraper):
     """Web searcher for AI/ML news using DuckDuckGo."""
     
-    def __init__(self, config: SourceConfig):
-        super().__init__(config)
+    def __init__(self, config: SourceConfig, client: httpx.AsyncClient | None = None):
+        super().__init__(config, client)
         self.search_config = config.web_search
     
     async def fetch(self, days_back: int = 3) -> list[IngestionResult]:
@@ -27,20 +74,42 @@ class WebSearcher(BaseScraper):
             return []
         
         max_results = self.search_config.get("max_results_per_query", 10)
+        # Queries run concurrently over the shared client; the semaphore
+        # keeps bursts small enough that DuckDuckGo does not throttle them
+        semaphore = asyncio.Semaphore(self.search_config.get("max_concurrent_queries", 3))
         
-        all_results = []
-        seen_urls = set()
-        
-        for query in queries:
+        async def search(query: str) -> list[tuple[str, str, str]]:
             try:
-                results = await self._search(query, max_results, days_back)
-                for result in results:
-                    # Deduplicate by URL
-                    if result.url not in seen_urls:
-                        seen_urls.add(result.url)
-                        all_results.append(result)
+                async with semaphore:
+                    return await self._search(query, max_results, days_back)
             except Exception as e:
                 logger.warning("Search query failed", query=query, error=str(e))
+                return []
+        
+        async with self.session():
+            batches = await asyncio.gather(*(search(query) for query in queries))
+        
+        # Deduplicate by canonical URL, earlier queries taking precedence;
+        # results are only built for URLs not seen before
+        all_results = []
+        seen_urls = set()
+        found_at = datetime.now(timezone.utc)  # Approximate publication time
+        for query, hits in zip(queries, batches, strict=True):
+            for url, title, snippet in hits:
+                key = canonical_url(url)
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
+                all_results.append(IngestionResult(
+                    title=title,
+                    url=url,
+                    source="Web Search",
+                    source_type="web_search",
+                    category="news",
+                    summary=snippet,
+                    published_at=found_at,
+                    metadata={"query": query},
+                ))
         
         logger.info("Web search completed", total_items=len(all_results), queries=len(queries))
         return all_results
@@ -50,72 +119,42 @@ class WebSearcher(BaseScraper):
         query: str,
         max_results: int,
         days_back: int
-    ) -> list[IngestionResult]:
-        """Perform a single search query using DuckDuckGo HTML."""
-        import httpx
-        import re
-        from urllib.parse import unquote
-        
+    ) -> list[tuple[str, str, str]]:
+        """Perform a single DuckDuckGo HTML search, returning (url, title, snippet) hits."""
         # Use DuckDuckGo HTML search
         url = "https://html.duckduckgo.com/html/"
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.get_timeout(),
-                follow_redirects=True
-            ) as client:
-                response = await client.post(
-                    url,
-                    data={"q": query, "df": "d"},  # df=d for past day, or remove for any time
-                    headers={
-                        "User-Agent": self.get_user_agent(),
-                        "Content-Type": "application/x-www-form-urlencoded",
-                    }
-                )
-                response.raise_for_status()
-                html = response.text
+            response = await self.request(
+                "POST",
+                url,
+                data={"q": query, "df": "d"},  # df=d for past day, or remove for any time
+                headers={
+                    "User-Agent": self.get_user_agent(),
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+            )
+            response.raise_for_status()
+            page = response.text
         except Exception as e:
             logger.warning("DuckDuckGo search failed", query=query, error=str(e))
             return []
         
         # Parse results from HTML
-        results = []
+        hits = []
         
-        # Extract result blocks
-        # DuckDuckGo HTML format: <a class="result__a" href="...">title</a>
-        # and <a class="result__snippet">snippet</a>
-        
-        # Find all result links
-        link_pattern = r'<a[^>]*class="result__a"[^>]*href="([^"]*)"[^>]*>([^<]*)</a>'
-        snippet_pattern = r'<a[^>]*class="result__snippet"[^>]*>([^<]*)</a>'
-        
-        links = re.findall(link_pattern, html)
-        snippets = re.findall(snippet_pattern, html)
-        
-        for i, (href, title) in enumerate(links[:max_results]):
-            # DuckDuckGo uses redirect URLs, extract actual URL
-            actual_url = href
-            if "uddg=" in href:
-                match = re.search(r'uddg=([^&]+)', href)
-                if match:
-                    actual_url = unquote(match.group(1))
+        for href, title, snippet in _parse_results(page, max_results):
+            # DuckDuckGo uses redirect URLs, extract actual URL; parse_qs
+            # already percent-decodes, so the target needs no unquote
+            params = parse_qs(urlsplit(href).query)
+            actual_url = params.get("uddg", [href])[0]
             
-            # Skip ad results
-            if "ad_provider" in href or not actual_url.startswith("http"):
+            # Skip ad results (tracked through an ad_provider query parameter)
+            if "ad_provider" in params or not actual_url.startswith("http"):
                 continue
             
-            snippet = snippets[i] if i < len(snippets) else ""
-            
-            results.append(IngestionResult(
-                title=title.strip(),
-                url=actual_url,
-                source="Web Search",
-                source_type="web_search",
-                category="news",
-                summary=snippet.strip(),
-                published_at=datetime.now(timezone.utc),  # Approximate
-                metadata={"query": query},
-            ))
+            hits.append((actual_url, title, snippet))
         
-        logger.debug("Search completed", query=query, count=len(results))
-        return results
+        if debug_enabled(__name__):
+            logger.debug("Search completed", query=query, count=len(hits))
+        return hits
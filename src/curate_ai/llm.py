@@ -1,9 +1,14 @@
 """LLM utilities using LiteLLM for OpenAI API access."""
 
-import os
+import asyncio
+import json
+from collections.abc import Iterable
+from functools import cache
 from typing import Any
 
-from litellm import acompletion
+import httpx
+import litellm
+from litellm import acompletion, supports_response_schema
 from pydantic import BaseModel
 
 from curate_ai.config import get_settings
@@ -12,11 +17,41 @@ from curate_ai.logging import get_logger
 logger = get_logger(__name__)
 
 
+@cache
+def _json_schema(response_model: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema of a response model, generated once per model class."""
+    return response_model.model_json_schema()
+
+
+@cache
+def _supports_json_schema(model: str) -> bool:
+    """Whether the model accepts a JSON schema `response_format`."""
+    try:
+        return supports_response_schema(model=model)
+    except Exception:
+        return False
+
+
 def setup_llm() -> None:
-    """Configure LiteLLM with API keys."""
-    settings = get_settings()
-    if settings.openai_api_key:
-        os.environ["OPENAI_API_KEY"] = settings.openai_api_key
+    """
+    Give LiteLLM one persistent HTTP/2 client for OpenAI-compatible calls.
+    
+    Every completion then reuses a pooled keepalive connection to the LLM
+    endpoint instead of each call setting up its own.
+    """
+    if litellm.aclient_session is None:
+        litellm.aclient_session = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(600.0, connect=10.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+
+
+async def close_llm() -> None:
+    """Close the HTTP client installed by setup_llm."""
+    if litellm.aclient_session is not None:
+        await litellm.aclient_session.aclose()
+        litellm.aclient_session = None
 
 
 async def llm_complete(
@@ -53,6 +88,7 @@ async def llm_complete(
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
+            api_key=settings.openai_api_key or None,
         )
         return response.choices[0].message.content or ""
     except Exception as e:
@@ -67,7 +103,11 @@ async def llm_structured(
     model: str | None = None,
 ) -> BaseModel:
     """
-    Make an LLM request with structured output using JSON mode.
+    Make an LLM request with structured output.
+    
+    Models that support it get the schema as a `json_schema` response
+    format, keeping it out of the prompt; others fall back to JSON mode
+    with the schema appended to the prompt.
     
     Args:
         prompt: The user prompt
@@ -81,33 +121,84 @@ async def llm_structured(
     settings = get_settings()
     model = model or settings.llm_model
 
-    # Add schema to prompt for JSON output
-    schema_json = response_model.model_json_schema()
-    structured_prompt = f"""{prompt}
+    schema = _json_schema(response_model)
+    if _supports_json_schema(model):
+        # Not strict: strict mode requires every property to be required,
+        # which optional fields in our response models are not
+        response_format: dict[str, Any] = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": response_model.__name__,
+                "schema": schema,
+                "strict": False,
+            },
+        }
+        user_prompt = prompt
+    else:
+        # Add schema to prompt for JSON output
+        response_format = {"type": "json_object"}
+        user_prompt = f"""{prompt}
 
 Respond with valid JSON matching this schema:
-{schema_json}
+{json.dumps(schema)}
 
 Return only the JSON object, no markdown or explanation."""
 
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
-    messages.append({"role": "user", "content": structured_prompt})
+    messages.append({"role": "user", "content": user_prompt})
 
     try:
         response = await acompletion(
             model=model,
             messages=messages,
             temperature=0.3,  # Lower temp for structured output
-            response_format={"type": "json_object"},
+            response_format=response_format,
+            api_key=settings.openai_api_key or None,
         )
         content = response.choices[0].message.content or "{}"
         
-        # Parse and validate with Pydantic
-        import json
-        data = json.loads(content)
-        return response_model.model_validate(data)
+        # Parse and validate in one step with Pydantic's native JSON parser
+        return response_model.model_validate_json(content)
     except Exception as e:
         logger.error("Structured LLM completion failed", error=str(e))
         raise
+
+
+async def llm_structured_batch(
+    prompts: Iterable[str],
+    response_model: type[BaseModel],
+    *,
+    concurrency: int | None = None,
+    system_prompt: str | None = None,
+    model: str | None = None,
+) -> list[BaseModel]:
+    """
+    Run llm_structured over many prompts concurrently.
+    
+    At most `concurrency` requests are in flight at once; the rest wait on
+    the semaphore, so a large batch applies steady back-pressure instead of
+    tripping provider rate limits. A failed call fails the whole batch.
+    
+    Args:
+        prompts: User prompts, one structured completion each
+        response_model: Pydantic model for every response
+        concurrency: Max in-flight requests (defaults to config)
+        system_prompt: Optional system prompt shared by all calls
+        model: Model to use (defaults to config)
+    
+    Returns:
+        Parsed Pydantic model instances, in the order of `prompts`
+    """
+    if concurrency is None:
+        concurrency = get_settings().max_concurrent_llm_calls
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(prompt: str) -> BaseModel:
+        async with semaphore:
+            return await llm_structured(
+                prompt, response_model, system_prompt=system_prompt, model=model
+            )
+
+    return await asyncio.gather(*(_one(prompt) for prompt in prompts))
@@ -57,5 +57,15 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def debug_enabled(name: str) -> bool:
+    """
+    Check whether DEBUG events for the named logger would be emitted.
+    
+    structlog builds the event dict before level filtering, so guard hot
+    debug calls with this to skip that work when DEBUG is off.
+    """
+    return logging.getLogger(name).isEnabledFor(logging.DEBUG)
+
+
 # Module-level logger
 logger = get_logger("curate_ai")
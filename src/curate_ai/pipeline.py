@@ -1,14 +1,19 @@
 """Pipeline orchestration for the Curate AI agent workflow."""
 
+import asyncio
 import hashlib
 import time
 import uuid
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 from curate_ai.agents.asset_curator import curate_assets_for_angles
 from curate_ai.agents.editor import create_email_brief, validate_brief_quality
 from curate_ai.agents.insight_generator import generate_angles_batch
-from curate_ai.agents.redundancy_checker import compute_embedding, deduplicate_angles
+from curate_ai.agents.redundancy_checker import angle_embeddings, deduplicate_angles
 from curate_ai.agents.relevance_filter import filter_topics
 from curate_ai.agents.schemas import EmailBrief, PipelineContext
 from curate_ai.agents.source_scout import collect_all_sources
@@ -16,7 +21,6 @@ from curate_ai.config import get_settings
 from curate_ai.db.repositories import (
     AgentRunRepository,
     AngleRepository,
-    EmailRepository,
     RejectedItemRepository,
     TopicRepository,
 )
@@ -26,18 +30,12 @@ from curate_ai.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def compute_config_hash() -> str:
     """Compute a hash of the current configuration for reproducibility."""
     settings = get_settings()
     config_str = f"{settings.llm_model}|{settings.arxiv_categories}|{settings.days_lookback}"
-    return hashlib.sha256(config_str.encode()).hexdigest()[:16]
-
-
-async def load_prior_embeddings() -> list[list[float]]:
-    """Load embeddings from prior angles for redundancy checking."""
-    # In a full implementation, this would query the database
-    # For now, returning empty list (no prior embeddings)
-    return []
+    return hashlib.blake2b(config_str.encode(), digest_size=8).hexdigest()
 
 
 async def run_pipeline(
@@ -76,188 +74,255 @@ async def run_pipeline(
         debug=debug,
     )
 
+    # Each write runs in its own short session, so no pooled connection is
+    # held idle while sources are fetched or the LLM stages run
+    run_uuid: uuid.UUID | None = None
     try:
         async with get_session() as session:
-            # Create run record
-            run_repo = AgentRunRepository(session)
-            topic_repo = TopicRepository(session)
-            angle_repo = AngleRepository(session)
-            rejected_repo = RejectedItemRepository(session)
-            email_repo = EmailRepository(session)
-
-            run = await run_repo.create(
+            run = await AgentRunRepository(session).create(
                 config_hash=config_hash,
                 metadata={"dry_run": dry_run, "debug": debug},
             )
             run_uuid = run.id
 
-            # ===== Stage 1: Source Scout =====
-            logger.info("Stage 1: Collecting sources")
-            ctx.topics = await collect_all_sources()
-            logger.info("Collected topics", count=len(ctx.topics))
-
-            if not ctx.topics:
-                logger.warning("No topics found, ending pipeline")
-                await run_repo.complete(
-                    run_uuid,
-                    duration_seconds=time.time() - start_time,
-                    error_message="No topics found",
-                )
-                return None
-
-            # Persist topics to database
-            for topic in ctx.topics:
-                await topic_repo.create(
-                    run_id=run_uuid,
-                    title=topic.title,
-                    source=topic.source,
-                    source_type=topic.source_type,
-                    url=topic.url,
-                    summary=topic.summary,
-                    published_at=topic.published_at,
-                )
-
-            # ===== Stage 2: Relevance Filter =====
-            logger.info("Stage 2: Filtering topics")
-            ctx.scored_topics = await filter_topics(ctx.topics)
-            ctx.filtered_topics = [t for t in ctx.scored_topics if not t.is_rejected]
+        # ===== Stage 1: Source Scout =====
+        logger.info("Stage 1: Collecting sources")
+        ctx.topics = await collect_all_sources()
+        logger.info("Collected topics", count=len(ctx.topics))
+
+        # Persist topics; URLs already recorded by an earlier run are skipped
+        # IDs are only generated for topics that reach persistence; the
+        # row shares the candidate's ID so angles can reference it. Each ID
+        # is parsed once and reused for the angle rows in Stage 3.
+        topic_ids = [(topic, topic.ensure_id()) for topic in ctx.topics]
+        topic_uuids = {tid: uuid.UUID(tid) for _, tid in topic_ids}
+        async with get_session() as session:
+            new_urls = await TopicRepository(session).bulk_create([
+                {
+                    "id": topic_uuids[tid],
+                    "run_id": run_uuid,
+                    "title": topic.title,
+                    "source": topic.source,
+                    "source_type": topic.source_type,
+                    "url": topic.url,
+                    "summary": topic.summary,
+                    "published_at": topic.published_at,
+                }
+                for topic, tid in topic_ids
+            ])
+        new_topics = []
+        for topic in ctx.topics:
+            if topic.url in new_urls:
+                new_urls.discard(topic.url)
+                new_topics.append(topic)
+        if len(new_topics) < len(ctx.topics):
             logger.info(
-                "Filtered topics",
-                input=len(ctx.topics),
-                passed=len(ctx.filtered_topics),
+                "Skipped previously seen topics",
+                skipped=len(ctx.topics) - len(new_topics),
             )
-
-            # Track rejections
-            for topic in ctx.scored_topics:
-                if topic.is_rejected and topic.rejection_reason:
-                    ctx.rejection_reasons[topic.rejection_reason] = (
-                        ctx.rejection_reasons.get(topic.rejection_reason, 0) + 1
-                    )
-
-            if not ctx.filtered_topics:
-                logger.warning("No topics passed filtering")
-                await run_repo.complete(
-                    run_uuid,
-                    duration_seconds=time.time() - start_time,
-                    error_message="No topics passed relevance filter",
-                )
-                return None
-
-            # ===== Stage 3: Insight Generator =====
-            logger.info("Stage 3: Generating insights")
-            ctx.angles = await generate_angles_batch(ctx.filtered_topics)
-            logger.info("Generated angles", count=len(ctx.angles))
-
-            # Persist angles
-            for angle in ctx.angles:
-                embedding = await compute_embedding(
-                    f"{angle.stance} {angle.why_it_matters}"
-                )
-                await angle_repo.create(
-                    run_id=run_uuid,
-                    topic_id=uuid.UUID(angle.topic_id),
-                    stance=angle.stance,
-                    why_it_matters=angle.why_it_matters,
-                    second_order_effects=angle.second_order_effects,
-                    relevant_for=angle.relevant_for,
-                    confidence=angle.confidence,
-                    embedding=embedding,
-                )
-
-            # ===== Stage 4: Redundancy Checker =====
-            logger.info("Stage 4: Checking redundancy")
-            prior_embeddings = await load_prior_embeddings()
-            ctx.deduplicated_angles, rejected = await deduplicate_angles(
-                ctx.angles, prior_embeddings
+        ctx.topics = new_topics
+
+        if not ctx.topics:
+            logger.warning("No new topics found, ending pipeline")
+            await _complete_run(run_uuid, start_time, error_message="No new topics found")
+            return None
+
+        # ===== Stage 2: Relevance Filter =====
+        logger.info("Stage 2: Filtering topics")
+        ctx.scored_topics = await filter_topics(ctx.topics)
+        ctx.filtered_topics = [t for t in ctx.scored_topics if not t.is_rejected]
+        logger.info(
+            "Filtered topics",
+            input=len(ctx.topics),
+            passed=len(ctx.filtered_topics),
+        )
+
+        # Track rejections
+        ctx.rejection_reasons.update(Counter(
+            t.rejection_reason for t in ctx.scored_topics if t.is_rejected and t.rejection_reason
+        ))
+
+        if not ctx.filtered_topics:
+            logger.warning("No topics passed filtering")
+            await _complete_run(
+                run_uuid, start_time, error_message="No topics passed relevance filter"
             )
-            logger.info(
-                "Deduplicated angles",
-                kept=len(ctx.deduplicated_angles),
-                rejected=len(rejected),
+            return None
+
+        # ===== Stage 3: Insight Generator =====
+        logger.info("Stage 3: Generating insights")
+        ctx.angles = await generate_angles_batch(ctx.filtered_topics)
+        logger.info("Generated angles", count=len(ctx.angles))
+
+        # Nothing to embed, persist or compare against prior runs
+        if not ctx.angles:
+            logger.warning("No angles generated")
+            await _complete_run(run_uuid, start_time, error_message="No angles generated")
+            return None
+
+        # ===== Stage 4: Redundancy Checker =====
+        logger.info("Stage 4: Checking redundancy")
+        # Prior angles are matched in Postgres through the HNSW index. The
+        # probe runs before this run's angles are stored, so none of them
+        # can crowd out a real match from an earlier run
+        async with get_session() as session:
+            ctx.deduplicated_angles, rejected = await deduplicate_angles(
+                ctx.angles, angle_repo=AngleRepository(session)
             )
-
-            # Track rejections
-            for angle, reason in rejected:
-                await rejected_repo.create(
-                    run_id=run_uuid,
-                    item_type="angle",
-                    item_id=uuid.UUID(angle.id),
-                    rejection_reason=reason,
-                    rejection_stage="redundancy",
-                )
-
-            if not ctx.deduplicated_angles:
-                logger.warning("All angles were redundant")
-                await run_repo.complete(
-                    run_uuid,
-                    duration_seconds=time.time() - start_time,
-                    error_message="All angles filtered as redundant",
-                )
-                return None
-
-            # ===== Stage 5: Asset Curator =====
-            logger.info("Stage 5: Curating assets")
-            source_urls = {
-                t.id: t.url for t in ctx.filtered_topics
+        logger.info(
+            "Deduplicated angles",
+            kept=len(ctx.deduplicated_angles),
+            rejected=len(rejected),
+        )
+
+        # Persist angles, expanding their cached sketches as one batch
+        embeddings = angle_embeddings(ctx.angles).astype(np.float16)
+        async with get_session() as session:
+            await AngleRepository(session).bulk_create([
+                {
+                    "id": uuid.UUID(angle.id),
+                    "run_id": run_uuid,
+                    "topic_id": topic_uuids[angle.topic_id],
+                    "stance": angle.stance,
+                    "why_it_matters": angle.why_it_matters,
+                    "second_order_effects": angle.second_order_effects,
+                    "relevant_for": angle.relevant_for,
+                    "confidence": angle.confidence,
+                    "embedding": embedding,
+                }
+                for angle, embedding in zip(ctx.angles, embeddings, strict=True)
+            ])
+
+        # Track rejections
+        rejected_rows = [
+            {
+                "run_id": run_uuid,
+                "item_type": "angle",
+                "item_id": uuid.UUID(angle.id),
+                "rejection_reason": reason,
+                "rejection_stage": "redundancy",
             }
-            ctx.assets = await curate_assets_for_angles(
+            for angle, reason in rejected
+        ]
+
+        if not ctx.deduplicated_angles:
+            logger.warning("All angles were redundant")
+            async with get_session() as session:
+                await RejectedItemRepository(session).bulk_create(rejected_rows)
+            await _complete_run(
+                run_uuid, start_time, error_message="All angles filtered as redundant"
+            )
+            return None
+
+        # ===== Stage 5: Asset Curator =====
+        logger.info("Stage 5: Curating assets")
+        source_urls: dict[str, str] = {}
+        topic_titles: dict[str, str] = {}
+        for topic in ctx.filtered_topics:
+            tid = topic.ensure_id()
+            source_urls[tid] = topic.url
+            topic_titles[tid] = topic.title
+        # Assets download in the background while the rejections are
+        # written and the editor stats are prepared
+        assets_task = asyncio.create_task(
+            curate_assets_for_angles(
                 ctx.deduplicated_angles,
                 source_urls,
                 download=not dry_run,
             )
-            logger.info(
-                "Curated assets",
-                total=sum(len(a) for a in ctx.assets.values()),
-            )
+        )
+        try:
+            async with get_session() as session:
+                await RejectedItemRepository(session).bulk_create(rejected_rows)
 
-            # ===== Stage 6: Editor =====
-            logger.info("Stage 6: Creating email brief")
-            topic_titles = {t.id: t.title for t in ctx.filtered_topics}
             stats = {
                 "topics_considered": len(ctx.topics),
                 "topics_filtered": len(ctx.filtered_topics),
                 "angles_generated": len(ctx.angles),
             }
 
-            ctx.email_brief = await create_email_brief(
-                run_id=run_id,
-                angles=ctx.deduplicated_angles,
-                assets_map=ctx.assets,
-                topic_titles=topic_titles,
-                stats=stats,
-            )
-
-            # Validate brief quality
-            issues = validate_brief_quality(ctx.email_brief)
-            if issues:
-                logger.warning("Brief quality issues", issues=issues)
-
-            # Mark selected angles
-            selected_ids = [
-                uuid.UUID(a.topic_id)  # Note: using topic_id as we don't have angle_id in final
-                for a in ctx.email_brief.angles
-            ]
-            if selected_ids:
-                await angle_repo.mark_selected(selected_ids)
-
-            # Complete the run
-            duration = time.time() - start_time
-            await run_repo.complete(run_uuid, duration_seconds=duration)
-
-            logger.info(
-                "Pipeline completed",
-                run_id=run_id,
-                duration=f"{duration:.2f}s",
-                angles=len(ctx.email_brief.angles),
-            )
-
-            return ctx.email_brief
+            ctx.assets = await assets_task
+        finally:
+            # Only has an effect if the rejection write failed first
+            assets_task.cancel()
+        logger.info(
+            "Curated assets",
+            total=sum(len(a) for a in ctx.assets.values()),
+        )
+
+        # ===== Stage 6: Editor =====
+        logger.info("Stage 6: Creating email brief")
+        ctx.email_brief = await create_email_brief(
+            run_id=run_id,
+            angles=ctx.deduplicated_angles,
+            assets_map=ctx.assets,
+            topic_titles=topic_titles,
+            stats=stats,
+        )
+
+        # Validate brief quality
+        issues = validate_brief_quality(ctx.email_brief)
+        if issues:
+            logger.warning("Brief quality issues", issues=issues)
+
+        # Mark selected angles in a single UPDATE
+        selected_ids = tuple(
+            uuid.UUID(a.angle_id) for a in ctx.email_brief.angles if a.angle_id
+        )
+        if selected_ids:
+            async with get_session() as session:
+                await AngleRepository(session).mark_selected(selected_ids)
+
+        # Complete the run
+        duration = await _complete_run(run_uuid, start_time)
+
+        logger.info(
+            "Pipeline completed",
+            run_id=run_id,
+            duration=f"{duration:.2f}s",
+            angles=len(ctx.email_brief.angles),
+        )
+
+        return ctx.email_brief
 
     except Exception as e:
         logger.error("Pipeline failed", run_id=run_id, error=str(e))
+        # Earlier stages have already committed, so record the failure on the
+        # run and release its topic URLs for the next run to retry
+        if run_uuid is not None:
+            try:
+                await _complete_run(
+                    run_uuid, start_time, error_message=str(e), release_urls=True
+                )
+            except Exception as mark_error:
+                logger.warning("Failed to mark run as failed", error=str(mark_error))
         raise
 
 
+async def _complete_run(
+    run_uuid: uuid.UUID,
+    start_time: float,
+    error_message: str | None = None,
+    release_urls: bool = False,
+) -> float:
+    """
+    Mark a run as finished in its own transaction and return its duration.
+    
+    With release_urls, the dedupe keys of the run's topics are cleared in the
+    same transaction, so a failed run does not mark its URLs as seen.
+    """
+    duration = time.time() - start_time
+    async with get_session() as session:
+        if release_urls:
+            await TopicRepository(session).release_urls(run_uuid)
+        await AgentRunRepository(session).complete(
+            run_uuid,
+            duration_seconds=duration,
+            error_message=error_message,
+        )
+    return duration
+
+
 async def run_pipeline_safe(
     dry_run: bool = False,
     debug: bool = False,
@@ -3,13 +3,16 @@
 import argparse
 import asyncio
 import sys
+from collections.abc import Coroutine
 from datetime import datetime, timezone
+from typing import Any, cast
 
 from curate_ai.config import get_settings
 from curate_ai.db.session import close_db, init_db
-from curate_ai.llm import setup_llm
+from curate_ai.llm import close_llm, setup_llm
 from curate_ai.logging import setup_logging, get_logger
 from curate_ai.pipeline import run_pipeline
+from curate_ai.services.http import close_http_client
 from curate_ai.services.slack_service import send_to_slack
 
 logger = get_logger(__name__)
@@ -109,9 +112,20 @@ async def run(
         return 1
 
     finally:
+        await close_http_client()
+        await close_llm()
         await close_db()
 
 
+def _run_event_loop(coro: Coroutine[Any, Any, int]) -> int:
+    """Run the coroutine on uvloop when it is installed, else on asyncio's loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return cast(int, uvloop.run(coro))
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -154,7 +168,7 @@ Examples:
     args = parser.parse_args()
 
     # Run async main
-    exit_code = asyncio.run(
+    exit_code = _run_event_loop(
         run(
             dry_run=args.dry_run,
             debug=args.debug,
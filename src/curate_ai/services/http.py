@@ -0,0 +1,33 @@
+"""Shared HTTP client for outbound calls made outside the ingestion scrapers."""
+
+import httpx
+
+# One pooled client per process, created on first use and closed by run()
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP/2 client.
+    
+    Slack deliveries and asset downloads go through this client, so repeat
+    calls to a host reuse a keepalive connection instead of paying a fresh
+    DNS lookup and TCP + TLS handshake each time.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,104 +1,84 @@
 """Slack notification service for sending research briefs via webhook."""
 
-import httpx
+from typing import Any
+
 from jinja2 import Template
 
-from curate_ai.agents.schemas import EmailBrief
+from curate_ai.agents.schemas import EmailBrief, FinalAngle
 from curate_ai.config import get_settings
 from curate_ai.logging import get_logger
+from curate_ai.services.http import get_http_client
 
 logger = get_logger(__name__)
 
 
-# Slack Block Kit template for the brief
-SLACK_TEMPLATE = """
-{
-    "blocks": [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "🔬 AI Research Brief",
-                "emoji": true
-            }
-        },
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "plain_text",
-                    "text": "{{ brief.generated_at.strftime('%B %d, %Y at %H:%M UTC') }} • {{ brief.angles | length }} insights"
-                }
-            ]
-        },
-        {
-            "type": "divider"
-        }
-        {%- for angle in brief.angles %},
+def _context(text: str, text_type: str = "mrkdwn") -> dict[str, Any]:
+    """Build a single-element Block Kit context block."""
+    return {"type": "context", "elements": [{"type": text_type, "text": text}]}
+
+
+def _angle_blocks(index: int, angle: FinalAngle) -> list[dict[str, Any]]:
+    """Build the Block Kit blocks for one insight."""
+    framing = "".join(f"• {point}\n" for point in angle.framing_points)
+    blocks: list[dict[str, Any]] = [
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": "*Insight {{ loop.index }}*\n\n*{{ angle.insight | replace('\"', '\\"') }}*\n\n{{ angle.why_it_matters | replace('\"', '\\"') }}"
-            }
-        },
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": "📍 *Relevant for:* {{ angle.relevant_for | join(', ') }}"
-                }
-            ]
+                "text": f"*Insight {index}*\n\n*{angle.insight}*\n\n{angle.why_it_matters}",
+            },
         },
+        _context(f"📍 *Relevant for:* {', '.join(angle.relevant_for)}"),
         {
             "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*💡 Framing Ideas:*\n{% for point in angle.framing_points %}• {{ point | replace('\"', '\\"') }}\n{% endfor %}"
-            }
-        }
-        {%- if angle.supporting_links %},
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": "🔗 {% for link in angle.supporting_links %}<{{ link }}|Source>{% if not loop.last %} • {% endif %}{% endfor %}"
-                }
-            ]
-        }
-        {%- endif %},
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "plain_text",
-                    "text": "Confidence: {{ (angle.confidence * 100) | int }}%"
-                }
-            ]
-        }
-        {%- if not loop.last %},
-        {
-            "type": "divider"
-        }
-        {%- endif %}
-        {%- endfor %},
-        {
-            "type": "divider"
+            "text": {"type": "mrkdwn", "text": f"*💡 Framing Ideas:*\n{framing}"},
         },
+    ]
+    if angle.supporting_links:
+        links = " • ".join(f"<{link}|Source>" for link in angle.supporting_links)
+        blocks.append(_context(f"🔗 {links}"))
+    blocks.append(_context(f"Confidence: {int(angle.confidence * 100)}%", "plain_text"))
+    return blocks
+
+
+def build_blocks(brief: EmailBrief) -> dict[str, Any]:
+    """
+    Build the Slack Block Kit payload for a brief.
+    
+    User text is placed in the dict verbatim; escaping is left to the JSON
+    encoder when the payload is posted.
+    
+    Args:
+        brief: The brief to render
+    
+    Returns:
+        Block Kit payload ready to send as JSON
+    """
+    count = len(brief.angles)
+    blocks = [
         {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": "📊 *Stats:* {{ brief.topics_considered }} topics → {{ brief.topics_filtered }} filtered → {{ brief.angles | length }} selected | Run: `{{ brief.run_id[:8] }}`"
-                }
-            ]
-        }
+            "type": "header",
+            "text": {"type": "plain_text", "text": "🔬 AI Research Brief", "emoji": True},
+        },
+        _context(
+            f"{brief.generated_at.strftime('%B %d, %Y at %H:%M UTC')} • {count} insights",
+            "plain_text",
+        ),
+        {"type": "divider"},
     ]
-}
-"""
+    for index, angle in enumerate(brief.angles, start=1):
+        if index > 1:
+            blocks.append({"type": "divider"})
+        blocks.extend(_angle_blocks(index, angle))
+    blocks.append({"type": "divider"})
+    blocks.append(
+        _context(
+            f"📊 *Stats:* {brief.topics_considered} topics → {brief.topics_filtered} filtered"
+            f" → {count} selected | Run: `{brief.run_id[:8]}`"
+        )
+    )
+    return {"blocks": blocks}
+
 
 # Simple text fallback for Slack
 SIMPLE_TEXT_TEMPLATE = """🔬 *AI Research Brief* - {{ brief.generated_at.strftime('%B %d, %Y') }}
@@ -121,20 +101,20 @@ SIMPLE_TEXT_TEMPLATE = """🔬 *AI Research Brief* - {{ brief.generated_at.strft
 📊 {{ brief.topics_considered }} topics → {{ brief.topics_filtered }} filtered → {{ brief.angles | length }} selected
 """
 
+# Compiled once per process; rendering is all that happens per send
+_SIMPLE_TEMPLATE = Template(SIMPLE_TEXT_TEMPLATE)
+
 
 class SlackService:
     """Service for sending briefs to Slack via webhook."""
 
     def __init__(self):
         self.settings = get_settings()
-        self.template = Template(SLACK_TEMPLATE)
-        self.simple_template = Template(SIMPLE_TEXT_TEMPLATE)
+        self.simple_template = _SIMPLE_TEMPLATE
 
-    def render_blocks(self, brief: EmailBrief) -> dict:
-        """Render the brief as Slack Block Kit JSON."""
-        import json
-        rendered = self.template.render(brief=brief)
-        return json.loads(rendered)
+    def render_blocks(self, brief: EmailBrief) -> dict[str, Any]:
+        """Render the brief as a Slack Block Kit payload."""
+        return build_blocks(brief)
 
     def render_simple(self, brief: EmailBrief) -> str:
         """Render as simple markdown text."""
@@ -164,24 +144,23 @@ class SlackService:
                 logger.warning("Block Kit render failed, using simple text", error=str(e))
                 payload = {"text": self.render_simple(brief)}
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
+            response = await get_http_client().post(
+                webhook_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+            )
+
+            if response.status_code == 200 and response.text == "ok":
+                logger.info(
+                    "Slack notification sent",
+                    run_id=brief.run_id,
+                    angles=len(brief.angles),
                 )
-
-                if response.status_code == 200 and response.text == "ok":
-                    logger.info(
-                        "Slack notification sent",
-                        run_id=brief.run_id,
-                        angles=len(brief.angles),
-                    )
-                    return True, None
-                else:
-                    error_msg = f"Slack API error: {response.status_code} - {response.text}"
-                    logger.error("Slack send failed", error=error_msg)
-                    return False, error_msg
+                return True, None
+            else:
+                error_msg = f"Slack API error: {response.status_code} - {response.text}"
+                logger.error("Slack send failed", error=error_msg)
+                return False, error_msg
 
         except Exception as e:
             error_msg = str(e)
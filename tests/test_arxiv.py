@@ -1,11 +1,39 @@
 """Tests for the arXiv API fetcher."""
 
+import httpx
 import pytest
 from datetime import datetime, timezone
 
 from curate_ai.ingestion.arxiv import ArxivFetcher
 from curate_ai.ingestion.base import SourceConfig, IngestionResult
 
+ARXIV_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2610.01234v1</id>
+    <published>2026-10-14T17:00:00Z</published>
+    <title>Sparse Attention at Scale
+</title>
+    <summary>We study sparse attention &amp; routing.</summary>
+    <author><name>Ada Lovelace</name></author>
+    <author><name>Alan Turing</name></author>
+    <link href="http://arxiv.org/abs/2610.01234v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2610.01234v1" rel="related"
+          type="application/pdf"/>
+    <arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2601.00001v2</id>
+    <published>2026-01-02T10:00:00Z</published>
+    <title>An older paper</title>
+    <summary>Submitted before the cutoff.</summary>
+  </entry>
+</feed>
+"""
+
 
 class TestArxivFetcher:
     """Tests for ArxivFetcher class."""
@@ -153,6 +181,33 @@ class TestArxivFetcher:
             assert "xml" in response.headers.get("content-type", "").lower()
 
 
+@pytest.mark.asyncio
+async def test_query_streams_entries_until_cutoff():
+    """Test that entries are parsed as they stream and older ones end the query."""
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=ARXIV_FEED))
+    )
+    fetcher = ArxivFetcher(SourceConfig(arxiv={"categories": ["cs.LG"]}), client)
+
+    async with client:
+        [result] = await fetcher._query(
+            fetcher.category_params["cs.LG"],
+            datetime(2026, 10, 1, tzinfo=timezone.utc),
+        )
+
+    assert result.title == "Sparse Attention at Scale"
+    assert result.url == "http://arxiv.org/abs/2610.01234v1"
+    assert result.summary == "We study sparse attention & routing."
+    assert result.published_at == datetime(2026, 10, 14, 17, tzinfo=timezone.utc)
+    assert result.authors == ["Ada Lovelace", "Alan Turing"]
+    assert result.tags == ["cs.LG", "cs.CL"]
+    assert result.metadata == {
+        "primary_category": "cs.LG",
+        "pdf_url": "http://arxiv.org/pdf/2610.01234v1",
+        "arxiv_id": "2610.01234v1",
+    }
+
+
 # Quick standalone test
 if __name__ == "__main__":
     import asyncio
@@ -1,10 +1,19 @@
 """Tests for redundancy checker agent."""
 
+import numpy as np
 import pytest
 from curate_ai.agents.redundancy_checker import (
+    angle_embeddings,
     cosine_similarity,
     compute_embedding,
+    compute_embeddings,
+    compute_sketch,
+    deduplicate_angles,
+    expand_sketch,
+    pairwise_cosine,
 )
+from curate_ai.agents.schemas import InsightAngle
+from curate_ai.config import get_settings
 
 
 class TestCosineSimilarity:
@@ -45,29 +54,145 @@ class TestCosineSimilarity:
         assert sim == 0.0
 
 
-@pytest.mark.asyncio
-async def test_compute_embedding():
+def test_compute_embedding():
     """Test embedding computation returns correct dimensions."""
     text = "This is a test sentence for embedding."
-    embedding = await compute_embedding(text)
+    embedding = compute_embedding(text)
     assert len(embedding) == 768  # Expected dimension
+    assert embedding.dtype == np.float32
+    assert np.isclose(np.linalg.norm(embedding), 1.0)
 
 
-@pytest.mark.asyncio
-async def test_embeddings_deterministic():
+def test_embeddings_deterministic():
     """Test that same text produces same embedding."""
     text = "Consistent text for testing."
-    embedding1 = await compute_embedding(text)
-    embedding2 = await compute_embedding(text)
-    assert embedding1 == embedding2
+    embedding1 = compute_embedding(text)
+    embedding2 = compute_embedding(text)
+    assert np.array_equal(embedding1, embedding2)
 
 
-@pytest.mark.asyncio
-async def test_different_texts_different_embeddings():
+def test_different_texts_different_embeddings():
     """Test that different texts produce different embeddings."""
     text1 = "First unique sentence."
     text2 = "Completely different content."
-    embedding1 = await compute_embedding(text1)
-    embedding2 = await compute_embedding(text2)
+    embedding1 = compute_embedding(text1)
+    embedding2 = compute_embedding(text2)
     # Embeddings should be different
-    assert embedding1 != embedding2
+    assert not np.array_equal(embedding1, embedding2)
+
+
+def test_compute_embeddings_batch():
+    """Test batched embeddings match the single-text path row for row."""
+    texts = ["First unique sentence.", "Completely different content."]
+    batch = compute_embeddings(texts)
+    assert batch.shape == (2, 768)
+    assert np.array_equal(batch[1], compute_embedding(texts[1]))
+
+
+def test_pairwise_cosine_matches_scalar():
+    """Test that the batched similarity matrix agrees with pairwise cosine_similarity."""
+    vectors = np.array([[0.1, 0.2, 0.3], [0.0, 0.0, 0.0], [3.0, -1.0, 2.0]], dtype=np.float32)
+    sims = pairwise_cosine(vectors)
+    assert sims.shape == (3, 3)
+    for i in range(3):
+        for j in range(3):
+            assert abs(sims[i, j] - cosine_similarity(vectors[i], vectors[j])) < 1e-5
+
+
+def test_sketch_preserves_cosine():
+    """Test that expanding sketches to full width leaves cosine unchanged."""
+    a = compute_sketch("First unique sentence.")
+    b = compute_sketch("Completely different content.")
+    assert abs(
+        cosine_similarity(a, b) - cosine_similarity(expand_sketch(a), expand_sketch(b))
+    ) < 1e-5
+
+
+def _make_angle(stance: str) -> InsightAngle:
+    return InsightAngle(
+        topic_id="topic-123",
+        stance=stance,
+        why_it_matters="This matters because it changes how we think about X.",
+        second_order_effects=["Effect 1"],
+        relevant_for=["ML engineers"],
+        confidence=0.8,
+    )
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_rejects_repeated_angle():
+    """Test that a repeated angle within a batch is rejected."""
+    first = _make_angle("Sparse attention is the next default.")
+    repeat = _make_angle("Sparse attention is the next default.")
+    other = _make_angle("Evaluation suites are lagging behind model capability.")
+
+    kept, rejected = await deduplicate_angles([first, repeat, other])
+
+    assert [a.id for a in kept] == [first.id, other.id]
+    assert len(rejected) == 1
+    assert rejected[0][0].id == repeat.id
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_against_prior_embeddings():
+    """Test that angles matching a prior embedding are rejected."""
+    angle = _make_angle("Sparse attention is the next default.")
+    prior = compute_embedding(f"{angle.stance} {angle.why_it_matters}")
+
+    kept, rejected = await deduplicate_angles([angle], [prior])
+
+    assert kept == []
+    assert len(rejected) == 1
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_rejects_untiled_prior_embeddings():
+    """Test that prior embeddings which are not expanded sketches are refused."""
+    angle = _make_angle("Sparse attention is the next default.")
+    prior = np.random.default_rng(0).standard_normal(get_settings().vector_dimension)
+
+    with pytest.raises(ValueError):
+        await deduplicate_angles([angle], [prior.tolist()])
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_against_repository():
+    """Test that the database nearest-neighbour similarity is used when a repo is given."""
+
+    class FakeAngleRepo:
+        def __init__(self) -> None:
+            self.calls: list[int | None] = []
+
+        async def get_max_similarities(self, embeddings, max_age_days=None):
+            self.calls.append(max_age_days)
+            return [0.99] * len(embeddings)
+
+    repo = FakeAngleRepo()
+    angle = _make_angle("Sparse attention is the next default.")
+
+    kept, rejected = await deduplicate_angles([angle], angle_repo=repo)
+
+    assert kept == []
+    assert len(rejected) == 1
+    assert repo.calls == [get_settings().redundancy_lookback_days]
+
+
+def test_angles_with_cached_sketches_compare_equal():
+    """Test that angles holding cached sketches still support equality checks."""
+    angle = _make_angle("Sparse attention is the next default.")
+    angle.sketch = tuple(compute_sketch("First").tolist())
+    copy = angle.model_copy(update={"sketch": tuple(compute_sketch("Second").tolist())})
+
+    assert angle != copy
+    assert angle in [copy, angle]
+
+
+def test_angle_embeddings_use_cached_sketch():
+    """Test that storage embeddings are expanded from the angle's cached sketch."""
+    angle = _make_angle("Sparse attention is the next default.")
+    angle.sketch = tuple(compute_sketch("Cached text").tolist())
+
+    embeddings = angle_embeddings([angle])
+
+    assert embeddings.shape == (1, 768)
+    assert np.allclose(embeddings[0], compute_embedding("Cached text"))
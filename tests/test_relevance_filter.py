@@ -2,7 +2,11 @@
 
 import pytest
 from curate_ai.agents.schemas import TopicCandidate
-from curate_ai.agents.relevance_filter import apply_heuristic_filters
+from curate_ai.agents.relevance_filter import (
+    apply_heuristic_filters,
+    count_indicators,
+    filter_topics,
+)
 
 
 class TestHeuristicFilters:
@@ -71,3 +75,38 @@ class TestHeuristicFilters:
         )
         should_reject, reason = apply_heuristic_filters(topic)
         assert should_reject is False
+
+    def test_count_indicators_matches_substring_semantics(self):
+        """Test that the single-pass scan counts each distinct indicator once."""
+        counts = count_indicators("Amazing API benchmark; an amazing LLM model for training")
+        assert counts == {"hype": 1, "practical": 2, "ai": 3}
+
+
+@pytest.mark.asyncio
+async def test_filter_topics_ranks_by_score():
+    """Test that concurrently scored topics are filtered and returned best first."""
+    plain = TopicCandidate(
+        title="A study of transformer models",
+        source="arXiv",
+        source_type="research",
+        url="https://arxiv.org/abs/1",
+        summary="We analyse attention patterns inside transformer language models at scale.",
+    )
+    practical = TopicCandidate(
+        title="Serving LLM models in production",
+        source="Blog",
+        source_type="blog",
+        url="https://example.com/2",
+        summary="A deployment guide with benchmark latency and throughput numbers for the API.",
+    )
+    hype = TopicCandidate(
+        title="Revolutionary game-changing AI",
+        source="Hype Blog",
+        source_type="blog",
+        url="https://example.com/3",
+        summary="An unprecedented, amazing and incredible model that changes everything forever.",
+    )
+
+    result = await filter_topics([plain, practical, hype])
+
+    assert [t.url for t in result] == [practical.url, plain.url]
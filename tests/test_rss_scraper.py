@@ -0,0 +1,83 @@
+"""Tests for the RSS/Atom feed scraper."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from curate_ai.ingestion.base import SourceConfig
+from curate_ai.ingestion.rss_scraper import RSSscraper, _iterparse_entries
+
+RSS_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Example Blog</title>
+    <item>
+      <title>Caf\xc3\xa9 &amp; Transformers</title>
+      <link>https://example.com/post</link>
+      <description>&lt;p&gt;Sparse attention &amp;amp; more&lt;/p&gt;</description>
+      <pubDate>Tue, 13 Oct 2026 08:00:00 +0200</pubDate>
+      <dc:creator>Jane Doe</dc:creator>
+      <category>llm</category>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Atom</title>
+  <entry>
+    <title>Scaling laws revisited</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link href="https://example.com/atom-post"/>
+    <summary>A look at compute-optimal training.</summary>
+    <updated>2026-10-14T12:00:00Z</updated>
+    <author><name>John Roe</name></author>
+    <category term="research"/>
+  </entry>
+</feed>
+"""
+
+
+class TestIterparseEntries:
+    """Tests for the incremental feed parser."""
+
+    def test_parses_rss_items(self):
+        """Test that RSS item fields are read and dates normalized to UTC."""
+        [entry] = list(_iterparse_entries(RSS_FEED))
+        assert entry["title"] == "Café & Transformers"
+        assert entry["link"] == "https://example.com/post"
+        assert entry["summary"] == "<p>Sparse attention &amp; more</p>"
+        assert entry["published"] == datetime(2026, 10, 13, 6, tzinfo=timezone.utc)
+        assert entry["authors"] == ["Jane Doe"]
+        assert entry["tags"] == ["llm"]
+
+    def test_parses_atom_entries(self):
+        """Test that Atom entries use the alternate link and namespaced children."""
+        [entry] = list(_iterparse_entries(ATOM_FEED))
+        assert entry["title"] == "Scaling laws revisited"
+        assert entry["link"] == "https://example.com/atom-post"
+        assert entry["summary"] == "A look at compute-optimal training."
+        assert entry["published"] == datetime(2026, 10, 14, 12, tzinfo=timezone.utc)
+        assert entry["authors"] == ["John Roe"]
+        assert entry["tags"] == ["research"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_falls_back_to_feedparser_for_malformed_feeds():
+    """Test that feeds expat rejects are still parsed by feedparser."""
+    malformed = RSS_FEED.replace(b"</channel>", b"")
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=malformed))
+    )
+    scraper = RSSscraper(
+        SourceConfig(rss_feeds=[{"name": "Example", "url": "https://example.com/feed"}]),
+        client,
+    )
+
+    async with client:
+        results = await scraper.fetch(days_back=10_000)
+
+    assert [r.url for r in results] == ["https://example.com/post"]
+    assert results[0].summary == "Sparse attention & more"
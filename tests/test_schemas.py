@@ -29,7 +29,10 @@ class TestTopicCandidate:
         assert topic.title == "Test Paper"
         assert topic.source == "arXiv"
         assert topic.source_type == "research"
-        assert topic.id is not None
+        assert topic.id is None
+        topic_id = topic.ensure_id()
+        assert topic.id == topic_id
+        assert topic.ensure_id() == topic_id
 
     def test_create_full(self):
         """Test creating topic with all fields."""
@@ -48,6 +51,18 @@ class TestTopicCandidate:
         assert len(topic.authors) == 2
         assert "llm" in topic.tags
 
+    @pytest.mark.parametrize("source_type", ["rss", "reddit", "web_search", "arxiv"])
+    def test_accepts_scraper_source_types(self, source_type):
+        """Test that every scraper's source_type is valid, as ingestion skips validation."""
+        topic = TopicCandidate(
+            title="Scraped",
+            source="Scraper",
+            source_type=source_type,
+            url="https://example.com",
+            summary="Scraped summary.",
+        )
+        assert topic.source_type == source_type
+
 
 class TestScoredTopic:
     """Tests for ScoredTopic schema."""
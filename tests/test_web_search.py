@@ -1,10 +1,14 @@
 """Tests for the Web Search scraper."""
 
-import pytest
 from datetime import datetime, timezone
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
 
-from curate_ai.ingestion.web_search import WebSearcher
-from curate_ai.ingestion.base import SourceConfig, IngestionResult
+from curate_ai.ingestion import base
+from curate_ai.ingestion.base import IngestionResult, SourceConfig, canonical_url
+from curate_ai.ingestion.web_search import WebSearcher, _parse_results
 
 
 class TestWebSearcher:
@@ -107,6 +111,82 @@ class TestWebSearcher:
         # All URLs should be unique (deduplication worked)
         assert len(urls) == len(unique_urls)
 
+    def test_parse_results_pairs_snippets_with_links(self):
+        """Test that a result without a snippet does not shift later snippets."""
+        page = """
+        <div class="result"><a rel="nofollow" class="result__a"
+        href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fa.com%2Fx&amp;rut=1">First &amp; best</a></div>
+        <div class="result"><a rel="nofollow" class="result__a" href="https://b.com/">Second</a>
+        <a class="result__snippet" href="https://b.com/">About <b>LLMs</b> today</a></div>
+        <div class="result"><a rel="nofollow" class="result__a" href="https://c.com/">Third</a></div>
+        """
+        
+        results = _parse_results(page, max_results=2)
+        
+        assert results == [
+            ("//duckduckgo.com/l/?uddg=https%3A%2F%2Fa.com%2Fx&rut=1", "First & best", ""),
+            ("https://b.com/", "Second", "About LLMs today"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_runs_queries_concurrently_and_dedupes(self):
+        """Test that concurrent queries are merged in query order without duplicate URLs."""
+        pages = {
+            "first": '<a class="result__a" href="https://a.com/">A</a>'
+                     '<a class="result__a" href="https://shared.com/">Shared</a>',
+            "second": '<a class="result__a" href="https://shared.com/">Shared again</a>'
+                      '<a class="result__a" href="https://b.com/">B</a>',
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            query = parse_qs(request.content.decode())["q"][0]
+            return httpx.Response(200, text=pages[query])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        searcher = WebSearcher(
+            SourceConfig(web_search={"enabled": True, "queries": ["first", "second"]}),
+            client,
+        )
+
+        async with client:
+            results = await searcher.fetch()
+
+        assert [r.url for r in results] == [
+            "https://a.com/", "https://shared.com/", "https://b.com/",
+        ]
+        assert [r.metadata["query"] for r in results] == ["first", "first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_standalone_fetch_shares_one_client(self, monkeypatch):
+        """Test that a scraper without an injected client opens one client per fetch."""
+        created: list[httpx.AsyncClient] = []
+
+        def build(settings):
+            client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, text=""))
+            )
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(base, "build_http_client", build)
+        searcher = WebSearcher(
+            SourceConfig(web_search={"enabled": True, "queries": ["a", "b", "c"]})
+        )
+
+        await searcher.fetch()
+
+        assert len(created) == 1
+        assert created[0].is_closed
+        assert searcher.client is None
+
+    def test_canonical_url_collapses_tracking_variants(self):
+        """Test that case, default ports, tracking params and trailing slashes are ignored."""
+        key = canonical_url("https://example.com/post?id=7")
+        assert canonical_url("HTTPS://Example.com:443/post/?utm_source=x&id=7#top") == key
+        assert canonical_url("https://example.com/post?fbclid=abc&id=7") == key
+        assert canonical_url("https://example.com/post?id=8") != key
+        assert canonical_url("https://example.com:8443/post?id=7") != key
+
     @pytest.mark.asyncio
     async def test_duckduckgo_connectivity(self):
         """Test that DuckDuckGo HTML search is reachable."""